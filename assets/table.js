@@ -0,0 +1,153 @@
+// Master list table: column sorting with group dividers, compact roll numbers on mobile.
+document.addEventListener('DOMContentLoaded', function() {
+    const table = document.querySelector('.table');
+    if (!table) return;
+    const tbody = table.querySelector('tbody');
+    const headers = table.querySelectorAll('th');
+    let sortState = { index: null, asc: true };
+    // Data rows in their current display order (divider rows excluded), kept in step with each sort
+    let currentRows = Array.from(tbody.querySelectorAll('tr:not(.divider-row)'));
+    let activeHeader = null;  // header showing the sort indicator (via .sort-asc/.sort-desc)
+    // One collator for every string comparison (localeCompare would look one up per call)
+    const collator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+
+    function titleForKey(key) {
+        const parts = (key || '').toLowerCase().split('-');
+        const stream = parts[0] || '';
+        const gender = parts[1] || '';
+        const streamTitle = stream === 'sc' ? 'Science' : stream === 'ar' ? 'Arts' : stream === 'co' ? 'Commerce' : 'Unknown';
+        const genderTitle = gender === 'b' ? 'Boys' : gender === 'g' ? 'Girls' : '';
+        return genderTitle ? `${streamTitle} - ${genderTitle}` : streamTitle;
+    }
+
+    function regIdKey(row) {
+        // Prefer the reg-id cell, fall back to the inner reg-id-main element
+        const cell = row.querySelector('.reg-id-cell') || row.querySelector('.reg-id-main');
+        const txt = cell ? cell.textContent.trim().toLowerCase() : '';
+        const parts = txt.split('-');
+        return parts.length >= 2 ? `${parts[0]}-${parts[1]}` : '';
+    }
+
+    function rollGroup(row) {
+        const cell = row.querySelector('.roll-cell');
+        const txt = cell ? cell.getAttribute('data-full-roll') || cell.textContent.trim() : '';
+        let groupChar = '';
+        // Try 9th char (index 8), fall back to 10th (index 9)
+        if (txt && txt.length > 8) groupChar = txt.charAt(8);
+        if (!groupChar && txt && txt.length > 9) groupChar = txt.charAt(9);
+        return groupChar === '1' ? 'Science' : groupChar === '2' ? 'Arts' : groupChar === '3' ? 'Commerce' : 'Unknown';
+    }
+
+    // Build the sorted rows (plus a divider row wherever groupOf changes) off-DOM,
+    // so the tbody is swapped in one mutation instead of N inserts
+    function buildRows(rows, groupOf, titleOf) {
+        const fragment = document.createDocumentFragment();
+        let lastGroup = null;
+        rows.forEach(row => {
+            const group = groupOf ? groupOf(row) : '';
+            if (group && group !== lastGroup) {
+                const tr = document.createElement('tr');
+                tr.className = 'divider-row';
+                const td = document.createElement('td');
+                td.colSpan = headers.length;
+                td.textContent = titleOf ? titleOf(group) : group;
+                tr.appendChild(td);
+                fragment.appendChild(tr);
+                lastGroup = group;
+            }
+            fragment.appendChild(row);
+        });
+        return fragment;
+    }
+
+    headers.forEach((th, index) => {
+        if (th.offsetParent === null) return; // Skip hidden headers
+        th.classList.add('sortable');
+        th.setAttribute('data-index', index);
+        th.addEventListener('click', () => {
+            const type = th.getAttribute('data-type') || 'string';
+            const asc = (sortState.index === index) ? !sortState.asc : true;
+            sortState = { index, asc };
+            const rows = currentRows;
+            // Read and parse each row's key once, then sort indexes against the keys
+            const keys = rows.map(row => {
+                const node = row.children[index];
+                let text = '';
+                if (node) {
+                    const regElem = (node.querySelector && node.querySelector('.reg-id-main')) || null;
+                    text = regElem ? regElem.textContent.trim() : node.textContent.trim();
+                }
+                const num = parseFloat(text.replace(/[^0-9.-]+/g, ''));
+                return { text, num, isNum: !isNaN(num), time: type === 'date' ? Date.parse(text) || 0 : 0 };
+            });
+            const order = rows.map((_, i) => i);
+            order.sort((i, j) => {
+                const a = keys[i];
+                const b = keys[j];
+                if (type === 'date') {
+                    return asc ? a.time - b.time : b.time - a.time;
+                }
+                if (a.isNum && b.isNum) {
+                    return asc ? a.num - b.num : b.num - a.num;
+                }
+                return asc ? collator.compare(a.text, b.text) : collator.compare(b.text, a.text);
+            });
+            const sorted = order.map(i => rows[i]);
+            currentRows = sorted;
+            // Move the indicator: two class writes instead of touching every header
+            if (activeHeader) activeHeader.classList.remove('sort-asc', 'sort-desc');
+            th.classList.add(asc ? 'sort-asc' : 'sort-desc');
+            activeHeader = th;
+
+            // Re-attach rows in new order; sorting by Registration ID or Roll adds dividers
+            const key = th.getAttribute('data-key');
+            if (key === 'registration_id') {
+                tbody.replaceChildren(buildRows(sorted, regIdKey, titleForKey));
+            } else if (key === 'roll') {
+                tbody.replaceChildren(buildRows(sorted, rollGroup));
+            } else {
+                tbody.replaceChildren(buildRows(sorted));
+            }
+        });
+    });
+
+    // Make rows clickable on mobile
+    tbody.addEventListener('click', function(e) {
+        if (window.innerWidth >= 768) return; // Only on mobile
+
+        // Don't interfere with clicks on links
+        if (e.target.tagName === 'A') return;
+
+        const row = e.target.closest('.clickable-row');
+        if (row && row.dataset.href) {
+            window.location.href = row.dataset.href;
+        }
+    });
+
+    // Update roll cells to show last 5 chars on tablet/mobile (<=1024px)
+    const rollCells = Array.from(document.querySelectorAll('.roll-cell'), td => [td, td.getAttribute('data-full-roll') || td.textContent || '']);
+    let compactRolls = null;
+    function updateRollCells() {
+        const width = window.innerWidth || document.documentElement.clientWidth;
+        const compact = width < 768;
+        if (compact === compactRolls) return; // Still on the same side of the breakpoint
+        compactRolls = compact;
+        rollCells.forEach(([td, full]) => {
+            td.textContent = compact && full.length > 5 ? '...' + full.slice(-5) : full;
+        });
+    }
+
+    // Resize fires many times per drag; run at most one update per frame
+    let rollFrame = 0;
+    function scheduleRollUpdate() {
+        if (rollFrame) return;
+        rollFrame = requestAnimationFrame(() => {
+            rollFrame = 0;
+            updateRollCells();
+        });
+    }
+
+    updateRollCells();
+    window.addEventListener('resize', scheduleRollUpdate);
+    window.addEventListener('orientationchange', scheduleRollUpdate);
+});
@@ -2,54 +2,351 @@
 
 Generate a default social-preview card at assets/meta_card.png.
 Run: python3 generate_meta_image.py --out assets/meta_card.png
+
+Batch mode renders many cards across a process pool, loading fonts and the
+logo once per worker:
+  python3 generate_meta_image.py --manifest cards.json [--jobs N]
+where cards.json is a JSON list of {"out": ..., "title": ..., "subtitle": ...}.
+
+With the default title and subtitle the card is copied from the pre-rendered
+assets/meta_card_template.png instead of being drawn, as long as the hash of
+inputs stored in it (text, fonts, logo and this script) still matches. Otherwise
+cards are drawn until it is regenerated:
+  python3 generate_meta_image.py --template "" --out assets/meta_card_template.png
+
+PNG encoding dominates render time; Pillow >= 11.1 wheels link zlib-ng, which
+roughly halves it (see requirements.txt).
 """
 import argparse
+import functools
+import hashlib
+import io
+import json
+import os
+import shutil
+import types
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-except Exception:
-    print("Pillow is required. Install with: pip install Pillow")
-    raise
+# Pillow is imported on first use so --help, argument errors and the template
+# copy path never pay its import cost.
+_pil = None
+
+
+def _require_pil():
+    """Import Pillow once and return the module holder with Image, ImageDraw and ImageFont,
+    plus the Pillow and FreeType versions text is rasterized with."""
+    global _pil
+    if _pil is None:
+        try:
+            import PIL
+            from PIL import Image, ImageDraw, ImageFont, features
+            from PIL.PngImagePlugin import PngInfo
+        except Exception:
+            print("Pillow is required. Install with: pip install Pillow")
+            raise
+        _pil = types.SimpleNamespace(Image=Image, ImageDraw=ImageDraw, ImageFont=ImageFont, PngInfo=PngInfo,
+                                     version=f"{PIL.__version__}|{features.version('freetype2')}")
+    return _pil
+
+W, H = 1200, 630
+BG = (16, 185, 129)
+FG = (255, 255, 255)
+DEFAULT_TITLE = "Verification Lookup"
+DEFAULT_SUBTITLE = "Chayannito 26"
+DEFAULT_TEMPLATE = "assets/meta_card_template.png"
+# PNG text chunk holding the _input_hash a card was rendered from
+_INPUTS_KEY = "inputs"
+# Files in the working directory that affect how a card looks
+_INPUT_FILES = ("logo.png", "Inter-Bold.ttf", "Inter-Regular.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans.ttf")
+# Rasterized text masks, keyed by Pillow/FreeType version, layout engine, font file, size and text
+MASK_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "chayannito26" / "text_masks"
+
+# The card only ever blends FG text over BG, so it is rendered as an 8-bit text
+# coverage canvas and saved as a palette PNG whose entry i is BG blended with FG
+# at alpha i/255. That is a third of the RGB data to draw into and Deflate, and
+# pixel-identical to drawing the text onto an RGB canvas.
+_PALETTE = [round(b + (f - b) * i / 255) for i in range(256) for b, f in zip(BG, FG)]
+
+# Empty coverage canvas, built on first use and copied for every card
+_BASE = None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size) and reuse the parsed face."""
+    return _require_pil().ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _cwd_files() -> frozenset:
+    """Names of regular files in the working directory, from a single scandir pass."""
+    with os.scandir(".") as it:
+        return frozenset(e.name for e in it if e.is_file())
+
+
+@functools.lru_cache(maxsize=64)
+def _text_mask(text: str, font):
+    """Rasterize text once per (text, font) into a coverage mask.
+
+    Returns (mask, dx, dy): pasting the mask at (x + dx, y + dy) reproduces
+    draw.text((x, y), text). Repeat cards (e.g. the fixed subtitle) then cost a
+    single paste instead of a FreeType glyph walk. Masks are also kept in
+    MASK_CACHE_DIR so later runs skip rasterization entirely.
+    """
+    Image, ImageDraw = _require_pil().Image, _require_pil().ImageDraw
+    cache_file = _mask_cache_file(text, font)
+    if cache_file is not None and cache_file.is_file():
+        try:
+            mask = Image.open(cache_file)
+            mask.load()
+            dx, dy = (int(v) for v in mask.info["offset"].split(","))
+            return mask, dx, dy
+        except Exception:
+            pass
+    left, top, right, bottom = font.getbbox(text)
+    dx, dy = min(left, 0), min(top, 0)
+    mask = Image.new("L", (max(right - dx, 1), max(bottom - dy, 1)), 0)
+    ImageDraw.Draw(mask).text((-dx, -dy), text, fill=255, font=font)
+    if cache_file is not None:
+        _store_mask(cache_file, mask, dx, dy)
+    return mask, dx, dy
+
+
+def _mask_cache_file(text: str, font) -> Path | None:
+    """On-disk location of the cached mask for (text, font), or None for built-in fonts.
+
+    The key includes the Pillow and FreeType versions and the font's layout engine,
+    so masks cached before an upgrade are not reused.
+    """
+    font_path = getattr(font, "path", None)
+    if not isinstance(font_path, str):
+        return None
+    try:
+        st = os.stat(font_path)
+    except OSError:
+        return None
+    key = f"{_require_pil().version}|{getattr(font, 'layout_engine', None)}|{os.path.abspath(font_path)}|{st.st_size}|{st.st_mtime_ns}|{font.size}|{text}"
+    return MASK_CACHE_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+
+
+def _store_mask(cache_file: Path, mask, dx: int, dy: int):
+    PngInfo = _require_pil().PngInfo
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        info = PngInfo()
+        info.add_text("offset", f"{dx},{dy}")
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        mask.save(tmp, format="PNG", pnginfo=info, compress_level=1)
+        os.replace(tmp, cache_file)
+    except Exception:
+        pass
+
+
+def _draw_text(img, xy, text: str, font):
+    mask, dx, dy = _text_mask(text, font)
+    img.paste(255, (xy[0] + dx, xy[1] + dy), mask)
+
 
+def _base_canvas():
+    global _BASE
+    if _BASE is None:
+        _BASE = _require_pil().Image.new("L", (W, H), color=0)
+    return _BASE
 
-def generate_default(out_path: Path):
-    W, H = 1200, 630
-    bg = (16, 185, 129)
-    fg = (255, 255, 255)
-    img = Image.new("RGB", (W, H), color=bg)
-    draw = ImageDraw.Draw(img)
+
+def load_fonts():
+    """Return the (title, subtitle) fonts."""
     try:
         # Prefer Inter fonts if bundled, otherwise fall back to DejaVu
-        if Path("Inter-Bold.ttf").is_file():
-            font = ImageFont.truetype("Inter-Bold.ttf", 56)
+        present = _cwd_files()
+        if "Inter-Bold.ttf" in present:
+            font = _load_font("Inter-Bold.ttf", 56)
         else:
-            font = ImageFont.truetype("DejaVuSans-Bold.ttf", 56)
-        if Path("Inter-Regular.ttf").is_file():
-            small = ImageFont.truetype("Inter-Regular.ttf", 28)
+            font = _load_font("DejaVuSans-Bold.ttf", 56)
+        if "Inter-Regular.ttf" in present:
+            small = _load_font("Inter-Regular.ttf", 28)
         else:
-            small = ImageFont.truetype("DejaVuSans.ttf", 28)
+            small = _load_font("DejaVuSans.ttf", 28)
     except Exception:
-        font = ImageFont.load_default()
-        small = ImageFont.load_default()
-    padding = 80
-    draw.text((padding, padding), "Chayannito 26", fill=fg, font=small)
-    draw.text((padding, padding + 48), "Verification Lookup", fill=fg, font=font)
-    # include the logo if present in repo root
+        font = _require_pil().ImageFont.load_default()
+        small = _require_pil().ImageFont.load_default()
+    return font, small
+
+
+@functools.lru_cache(maxsize=1)
+def load_logo():
+    """Return the repo-root logo as a 96px thumbnail (RGBA, or RGB if opaque), or None if absent."""
+    Image = _require_pil().Image
     try:
-        logo_path = Path("logo.png")
-        if logo_path.is_file():
-            logo = Image.open(logo_path).convert("RGBA")
-            logo.thumbnail((96, 96), Image.LANCZOS)
-            img.paste(logo, (W - 96 - 40, 40), logo)
+        if "logo.png" in _cwd_files():
+            logo = Image.open("logo.png").convert("RGBA")
+            # Lanczos buys nothing visible at 96px; area-average for large
+            # downscales, bilinear for small ones, nothing if it already fits.
+            if max(logo.size) > 96:
+                logo.thumbnail((96, 96), Image.BOX if max(logo.size) >= 192 else Image.BILINEAR)
+            # A fully opaque logo can be pasted as a plain copy, without alpha blending
+            if logo.getextrema()[3] == (255, 255):
+                logo = logo.convert("RGB")
+            return logo
     except Exception:
         pass
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(out_path, format="PNG")
+    return None
+
+
+def _png_text(path: Path, key: str) -> str | None:
+    """Value of a tEXt chunk in a PNG, read from the chunks ahead of the image data (no Pillow needed)."""
+    with open(path, "rb") as f:
+        if f.read(8) != b"\x89PNG\r\n\x1a\n":
+            return None
+        while True:
+            head = f.read(8)
+            if len(head) < 8 or head[4:] in (b"IDAT", b"IEND"):
+                return None
+            data = f.read(int.from_bytes(head[:4], "big"))
+            f.seek(4, os.SEEK_CUR)  # CRC
+            if head[4:] == b"tEXt":
+                name, _, value = data.partition(b"\0")
+                if name == key.encode("latin-1"):
+                    return value.decode("latin-1")
+
+
+def _template_is_current(template: Path) -> bool:
+    """True if the template exists and was rendered from the current default inputs."""
+    try:
+        return _png_text(template, _INPUTS_KEY) == _input_hash(DEFAULT_TITLE, DEFAULT_SUBTITLE)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _file_digest(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _input_hash(title: str, subtitle: str) -> str:
+    """Digest of everything that determines a card: text, logo, fonts and this script."""
+    h = hashlib.sha256()
+    h.update(title.encode("utf-8") + b"\0" + subtitle.encode("utf-8") + b"\0")
+    present = _cwd_files()
+    for dep in _INPUT_FILES:
+        if dep in present:
+            h.update(dep.encode("utf-8") + _file_digest(dep))
+    h.update(_file_digest(__file__))
+    return h.hexdigest()
+
+
+def generate_default(out_path: Path, title: str = DEFAULT_TITLE, subtitle: str = DEFAULT_SUBTITLE,
+                     font=None, small=None, logo_img=None, load_logo_if_missing: bool = True,
+                     template: Path | None = None, skip_unchanged: bool = False):
+    """Render one card to out_path.
+
+    Fonts and logo may be passed in so batch callers load them only once; when
+    omitted they are loaded here. If a template is given and the card would use
+    the default text, the template is copied instead of rendering. With
+    skip_unchanged, a card whose .sha256 sidecar matches its inputs is left as is.
+    """
+    sidecar = out_path.with_suffix(out_path.suffix + ".sha256")
+    digest = _input_hash(title, subtitle)
+    if skip_unchanged:
+        try:
+            if out_path.is_file() and sidecar.read_text(encoding="utf-8") == digest:
+                print(f"Unchanged {out_path}")
+                return
+        except OSError:
+            pass
+    if (template is not None and title == DEFAULT_TITLE and subtitle == DEFAULT_SUBTITLE
+            and _template_is_current(template)):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        if template.resolve() != out_path.resolve():
+            shutil.copyfile(template, out_path)
+        print(f"Wrote {out_path} (from template {template})")
+        if skip_unchanged:
+            sidecar.write_text(digest, encoding="utf-8")
+        return
+    if font is None or small is None:
+        font, small = load_fonts()
+    if logo_img is None and load_logo_if_missing:
+        logo_img = load_logo()
+    img = _base_canvas().copy()
+    padding = 80
+    _draw_text(img, (padding, padding), subtitle, small)
+    _draw_text(img, (padding, padding + 48), title, font)
+    img = img.convert("P")
+    img.putpalette(_PALETTE)
+    # include the logo if present in repo root; its colors need a full RGB canvas
+    if logo_img is not None:
+        img = img.convert("RGB")
+        img.paste(logo_img, (W - 96 - 40, 40), logo_img if logo_img.mode == "RGBA" else None)
+    _write_png(img, out_path, digest)
+    if skip_unchanged:
+        sidecar.write_text(digest, encoding="utf-8")
     print(f"Wrote {out_path}")
 
+
+def _write_png(img, out_path: Path, inputs: str):
+    """Encode img in memory, tagged with its input hash, and write it to out_path with a single write()."""
+    info = _require_pil().PngInfo()
+    info.add_text(_INPUTS_KEY, inputs)
+    buf = io.BytesIO()
+    # The card is a few flat colors, so Deflate level 1 costs only a modestly larger
+    # file than the default level 6 and is several times faster (more so on zlib-ng).
+    img.save(buf, format="PNG", compress_level=1, optimize=False, pnginfo=info)
+    data = buf.getbuffer()
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "wb", buffering=0) as f:
+        f.write(data)
+        # Cards are write-once build outputs; keep them out of the page cache
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(f.fileno(), 0, len(data), os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+
+def _render_one(card: dict, skip_unchanged: bool = False):
+    """Render a single manifest entry; fonts and logo come from the per-process caches."""
+    generate_default(
+        Path(card["out"]),
+        card.get("title", DEFAULT_TITLE),
+        card.get("subtitle", DEFAULT_SUBTITLE),
+        skip_unchanged=skip_unchanged,
+    )
+
+
+def generate_from_manifest(manifest_path: Path, jobs: int | None = None, skip_unchanged: bool = False):
+    """Render every card listed in a JSON manifest of {out, title, subtitle} objects.
+
+    Cards are independent, so they are spread over a process pool; each worker
+    loads the fonts and logo once. jobs=1 renders in this process.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as fh:
+        cards = json.load(fh)
+    render = functools.partial(_render_one, skip_unchanged=skip_unchanged)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(cards) <= 1:
+        for card in cards:
+            render(card)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            list(ex.map(render, cards, chunksize=16))
+    print(f"Rendered {len(cards)} cards from {manifest_path}")
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("--out", default="assets/meta_card.png")
+    parser.add_argument("--title", default=DEFAULT_TITLE)
+    parser.add_argument("--subtitle", default=DEFAULT_SUBTITLE)
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE, help="Pre-rendered default card to copy when no text override is given (empty string to always render)")
+    parser.add_argument("--manifest", default=None, help="JSON list of {out, title, subtitle} cards to render in one process")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for --manifest (default: CPU count)")
+    parser.add_argument("--skip-unchanged", action="store_true", help="Skip cards whose .sha256 sidecar matches the current inputs")
     args = parser.parse_args()
-    generate_default(Path(args.out))
+    if args.manifest:
+        generate_from_manifest(Path(args.manifest), args.jobs, args.skip_unchanged)
+    else:
+        generate_default(Path(args.out), args.title, args.subtitle,
+                         template=Path(args.template) if args.template else None,
+                         skip_unchanged=args.skip_unchanged)
@@ -13,6 +13,9 @@ Usage examples:
   - Build specific IDs only:      python3 generate_verifications.py --out ../dist --ids SC-B-0001,AR-G-0001
   - Generate and cache meta:      python3 generate_verifications.py --out ../dist --clean --cache-meta
   - Force regenerate meta:        python3 generate_verifications.py --out ../dist --clean --regenerate-meta
+  - Limit worker processes:       python3 generate_verifications.py --out ../dist --jobs 4
+  - Log every file processed:     python3 generate_verifications.py --out ../dist --verbose
+  - Single tarball of the site:   python3 generate_verifications.py --out ../dist --clean --archive
 
 Meta Image Caching:
   By default, the script uses cached meta images from meta_images/ directory if available.
@@ -21,12 +24,26 @@ Meta Image Caching:
   Use --regenerate-meta to force regeneration of all meta images (ignoring cache).
 """
 
+import os
+import re
+import sys
+import html
 import json
+import time
 import base64
-import codecs
 import shutil
+import socket
+import tarfile
 import argparse
 import hashlib
+import logging
+import functools
+import multiprocessing
+import urllib.parse
+import urllib.request
+from io import BytesIO, StringIO
+from urllib.error import HTTPError, URLError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -36,6 +53,8 @@ from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeEl
 from rich.traceback import install as rich_traceback_install
 from rich.panel import Panel
 from rich.theme import Theme
+from rich.text import Text
+from rich.logging import RichHandler
 
 # Optional Pillow for meta image generation
 try:
@@ -44,16 +63,112 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
+# Optional orjson for faster JSON parsing and serialization (stdlib json accepts bytes too)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except Exception:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+# Optional certifi CA bundle for avatar downloads (fixes local SSL verification in some envs)
+try:
+    import ssl, certifi
+    _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+except Exception:
+    _SSL_CTX = None
+# One opener (and TLS context) for every avatar download in the process
+_OPENER = urllib.request.build_opener(*([urllib.request.HTTPSHandler(context=_SSL_CTX)] if _SSL_CTX else []))
+
 # Resolve paths relative to this script
 SCRIPT_DIR = Path(__file__).resolve().parent
 
 # --- Constants ---
 # These IDs will always be generated, even if not in registrants.json
 PLACEHOLDER_IDS = ["SC-B-0001", "SC-G-0001", "AR-B-0001", "AR-G-0001", "CO-B-0001", "CO-G-0001"]
+# Site label drawn on every meta card
+SITE_NAME = "Chayannito 26"
 # Path definitions
 ROOT_DIR = SCRIPT_DIR
 REG_JSON = SCRIPT_DIR / "registrants.json"
 TEMPLATE_FILE = SCRIPT_DIR / "template.html"
+MASTER_TEMPLATE_FILE = SCRIPT_DIR / "master_template.html"
+# Downloaded remote avatars, keyed by sha1(url)
+AVATAR_CACHE_DIR = SCRIPT_DIR / ".cache" / "avatars"
+AVATAR_MAX_AGE = 7 * 24 * 3600  # seconds before a cached avatar is revalidated
+MANIFEST_NAME = ".manifest.json"  # page content and meta image input hashes from the previous build
+ARCHIVE_NAME = "verifications.tar"  # --archive output, written inside --out
+# rot13 as a str.translate table (same result as codecs "rot_13", without the codec lookup)
+_ROT13 = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    "NOPQRSTUVWXYZABCDEFGHIJKLMnopqrstuvwxyzabcdefghijklm",
+)
+# {{key}} placeholders in template.html
+_PH_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Accent mapping for the three page states, selected per registrant in render_template
+_STATUS_REVOKED = {
+    "title_status": "Revoked",
+    "avatar_border_class": "border-red-500",
+    "avatar_filter_class": "grayscale",
+    "status_badge_bg": "bg-red-500",
+    "status_icon_path": "M6 18L18 6M6 6l12 12",
+    "status_text_class": "text-red-600",
+    "status_text": "Registration Revoked",
+    "footer_bar_bg_class": "bg-red-50",
+    "footer_bar_border_class": "border-red-100",
+    "id_text_class": "text-red-800",
+    "id_badge_bg_class": "bg-red-200",
+    "revoked_banner": (
+        '<div style="margin-bottom: 1rem; width: 100%; max-width: 24rem; border-radius: 0.75rem; border: 1px solid #fecaca; '
+        'background-color: #fef2f2; padding: 1rem; font-size: 0.875rem; font-weight: 500; color: #b91c1c;">'
+        'This registration has been revoked. If you believe this is an error, please contact the organizers.'
+        "</div>"
+    ),
+}
+_STATUS_PLACEHOLDER = {
+    "title_status": "Not Registered",
+    "avatar_border_class": "border-gray-300",
+    "avatar_filter_class": "grayscale",
+    "status_badge_bg": "bg-gray-400",
+    "status_icon_path": "M8.228 9c.549-1.165 2.03-2 3.772-2 2.21 0 4 1.343 4 3 0 1.4-1.278 2.575-3.006 2.907-.542.104-.994.54-.994 1.093m0 3h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z",
+    "status_text_class": "text-gray-600",
+    "status_text": "Not Yet Registered",
+    "footer_bar_bg_class": "bg-gray-50",
+    "footer_bar_border_class": "border-gray-100",
+    "id_text_class": "text-gray-800",
+    "id_badge_bg_class": "bg-gray-200",
+    "revoked_banner": (
+        '<div style="margin-bottom: 1rem; width: 100%; max-width: 24rem; border-radius: 0.75rem; border: 1px solid #fde68a; '
+        'background-color: #fffbeb; color: #92400e; padding: 1rem; font-size: 0.875rem; font-weight: 500;">'
+        'No one has registered for this slot yet. Please retry later.'
+        "</div>"
+    ),
+}
+_STATUS_VERIFIED = {
+    "title_status": "Verified",
+    "avatar_border_class": "border-green-500",
+    "avatar_filter_class": "",
+    "status_badge_bg": "bg-green-500",
+    "status_icon_path": "M5 13l4 4L19 7",
+    "status_text_class": "text-green-600",
+    "status_text": "Registration Verified",
+    "footer_bar_bg_class": "bg-green-50",
+    "footer_bar_border_class": "border-green-100",
+    "id_text_class": "text-green-800",
+    "id_badge_bg_class": "bg-green-200",
+    "revoked_banner": "",
+}
+
+# (stream, gender) registration_id prefixes -> statistics bucket
+_STREAM_MAP = {"sc": "science", "ar": "arts", "co": "commerce"}
+_GENDER_MAP = {"b": "boys", "g": "girls"}
+_STAT_KEYS = {(s, g): f"{stream}_{gender}" for s, stream in _STREAM_MAP.items() for g, gender in _GENDER_MAP.items()}
 
 # Rich setup
 CUSTOM_THEME = Theme({
@@ -64,342 +179,532 @@ CUSTOM_THEME = Theme({
     "path": "magenta",
 })
 console = Console(theme=CUSTOM_THEME)
+# Per-file progress goes to this logger at DEBUG; the console keeps warnings and the summary
+log = logging.getLogger("verify")
 rich_traceback_install(show_locals=False)
 
 def calculate_statistics(registrants: list[dict]) -> dict:
     """Calculate registration statistics based on registration_id."""
-    stats = {
-        "science_boys": 0, "science_girls": 0,
-        "arts_boys": 0, "arts_girls": 0,
-        "commerce_boys": 0, "commerce_girls": 0,
-    }
+    stats = dict.fromkeys(_STAT_KEYS.values(), 0)
+    total = 0
     for r in registrants:
-        reg_id = r.get("registration_id", "").lower()
-        if not reg_id or r.get("is_placeholder"):
-            continue
-
-        parts = reg_id.split('-')
-        if len(parts) < 2:
+        if r.get("is_placeholder"):
             continue
-        
-        stream = parts[0]
-        gender = parts[1]
-
-        if stream == 'sc':
-            if gender == 'b':
-                stats['science_boys'] += 1
-            elif gender == 'g':
-                stats['science_girls'] += 1
-        elif stream == 'ar':
-            if gender == 'b':
-                stats['arts_boys'] += 1
-            elif gender == 'g':
-                stats['arts_girls'] += 1
-        elif stream == 'co':
-            if gender == 'b':
-                stats['commerce_boys'] += 1
-            elif gender == 'g':
-                stats['commerce_girls'] += 1
+        total += 1
+        # "SC-B-0001" -> ("sc", "b"); unknown prefixes are counted in total only
+        key = _STAT_KEYS.get(tuple(r.get("registration_id", "").lower().split("-", 2)[:2]))
+        if key:
+            stats[key] += 1
 
     stats["total_science"] = stats["science_boys"] + stats["science_girls"]
     stats["total_arts"] = stats["arts_boys"] + stats["arts_girls"]
     stats["total_commerce"] = stats["commerce_boys"] + stats["commerce_girls"]
     stats["total_boys"] = stats["science_boys"] + stats["arts_boys"] + stats["commerce_boys"]
     stats["total_girls"] = stats["science_girls"] + stats["arts_girls"] + stats["commerce_girls"]
-    stats["total"] = len([r for r in registrants if not r.get("is_placeholder")])
+    stats["total"] = total
     
     return stats
 
+@functools.lru_cache(maxsize=None)
 def id_to_filename(reg_id: str) -> str:
-    b64 = base64.urlsafe_b64encode(reg_id.encode('utf-8')).decode('utf-8')
-    b64 = b64.rstrip("=")
-    rot = codecs.encode(b64, "rot_13")
-    return rot[::-1]
-
-def render_template(template_text: str, data: dict, extra: dict | None = None) -> str:
-    out = template_text
-    revoked = True if data.get("revoked") is True else False
-    is_placeholder = data.get("is_placeholder", False)
-
-    # Accent mapping
-    if revoked:
-        title_status = "Revoked"
-        avatar_border_class = "border-red-500"
-        avatar_filter_class = "grayscale"
-        status_badge_bg = "bg-red-500"
-        status_icon_path = "M6 18L18 6M6 6l12 12"
-        status_text_class = "text-red-600"
-        status_text = "Registration Revoked"
-        footer_bar_bg_class = "bg-red-50"
-        footer_bar_border_class = "border-red-100"
-        id_text_class = "text-red-800"
-        id_badge_bg_class = "bg-red-200"
-        revoked_banner = (
-            '<div style="margin-bottom: 1rem; width: 100%; max-width: 24rem; border-radius: 0.75rem; border: 1px solid #fecaca; '
-            'background-color: #fef2f2; padding: 1rem; font-size: 0.875rem; font-weight: 500; color: #b91c1c;">'
-            'This registration has been revoked. If you believe this is an error, please contact the organizers.'
-            "</div>"
-        )
-    elif is_placeholder:
-        title_status = "Not Registered"
-        avatar_border_class = "border-gray-300"
-        avatar_filter_class = "grayscale"
-        status_badge_bg = "bg-gray-400"
-        status_icon_path = "M8.228 9c.549-1.165 2.03-2 3.772-2 2.21 0 4 1.343 4 3 0 1.4-1.278 2.575-3.006 2.907-.542.104-.994.54-.994 1.093m0 3h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"
-        status_text_class = "text-gray-600"
-        status_text = "Not Yet Registered"
-        footer_bar_bg_class = "bg-gray-50"
-        footer_bar_border_class = "border-gray-100"
-        id_text_class = "text-gray-800"
-        id_badge_bg_class = "bg-gray-200"
-        revoked_banner = (
-            '<div style="margin-bottom: 1rem; width: 100%; max-width: 24rem; border-radius: 0.75rem; border: 1px solid #fde68a; '
-            'background-color: #fffbeb; color: #92400e; padding: 1rem; font-size: 0.875rem; font-weight: 500;">'
-            'No one has registered for this slot yet. Please retry later.'
-            "</div>"
-        )
-    else:
-        title_status = "Verified"
-        avatar_border_class = "border-green-500"
-        avatar_filter_class = ""
-        status_badge_bg = "bg-green-500"
-        status_icon_path = "M5 13l4 4L19 7"
-        status_text_class = "text-green-600"
-        status_text = "Registration Verified"
-        footer_bar_bg_class = "bg-green-50"
-        footer_bar_border_class = "border-green-100"
-        id_text_class = "text-green-800"
-        id_badge_bg_class = "bg-green-200"
-        revoked_banner = ""
+    b64 = base64.urlsafe_b64encode(reg_id.encode('utf-8')).rstrip(b"=").decode('ascii')
+    return b64.translate(_ROT13)[::-1]
+
+def _compile_template(template_text: str) -> list[str]:
+    """Split a template once into alternating literal text and placeholder names.
+
+    Even indices are literal text, odd indices are the names inside {{...}}.
+    """
+    return _PH_RE.split(template_text)
+
+def _status_for(data: dict) -> dict:
+    """Status placeholders for a registrant: revoked wins over placeholder, else verified."""
+    if data.get("revoked") is True:
+        return _STATUS_REVOKED
+    return _STATUS_PLACEHOLDER if data.get("is_placeholder") else _STATUS_VERIFIED
+
+def _fill_template(segments: list[str], values: dict) -> str:
+    """Join compiled template segments, substituting values; unknown placeholders are left untouched."""
+    return "".join(
+        str(values.get(seg, "{{" + seg + "}}")) if i & 1 else seg
+        for i, seg in enumerate(segments)
+    )
+
+@functools.lru_cache(maxsize=1)
+def _master_template() -> list[str]:
+    """master_template.html (the master list page shell), compiled once."""
+    return _compile_template(MASTER_TEMPLATE_FILE.read_text(encoding="utf-8"))
+
+def render_template(segments: list[str], data: dict, extra: dict | None = None, status: dict | None = None) -> str:
+    if status is None:
+        status = _status_for(data)
 
     placeholders = {
+        **status,
         "name": data.get("name", ""),
         "roll": data.get("roll", ""),
         "gender": data.get("gender", ""),
         "registration_date": data.get("registration_date", ""),
         "registration_id": data.get("registration_id", ""),
         "photo": data.get("photo", "") or f"https://chayannito26.com/college-students/images/{data.get('roll', 'placeholder')}.jpg",
-        "title_status": title_status,
-        "avatar_border_class": avatar_border_class,
-        "avatar_filter_class": avatar_filter_class,
-        "status_badge_bg": status_badge_bg,
-        "status_icon_path": status_icon_path,
-        "status_text_class": status_text_class,
-        "status_text": status_text,
-        "footer_bar_bg_class": footer_bar_bg_class,
-        "footer_bar_border_class": footer_bar_border_class,
-        "id_text_class": id_text_class,
-        "id_badge_bg_class": id_badge_bg_class,
-        "revoked_banner": revoked_banner,
         "referred_by_section": "",
     }
     if extra:
         placeholders.update(extra)
-    for key, val in placeholders.items():
-        out = out.replace("{{" + key + "}}", str(val))
-    return out
+    return _fill_template(segments, placeholders)
+
+
+_MADE_DIRS: set[str] = set()
+
+def _ensure_dir(path: str | Path):
+    """mkdir -p, once per directory per process."""
+    key = os.fspath(path)
+    if key not in _MADE_DIRS:
+        os.makedirs(key, exist_ok=True)
+        _MADE_DIRS.add(key)
 
+def _forget_dirs(root: str | Path):
+    """Drop root and everything under it from _ensure_dir's cache (after the tree is deleted)."""
+    root = os.fspath(root)
+    prefix = os.path.join(root, "")
+    _MADE_DIRS.difference_update([d for d in _MADE_DIRS if d == root or d.startswith(prefix)])
 
-def _compute_meta_hash(name: str, roll: str, registration_id: str, photo_url: str | None, status_text: str, registration_date: str | None) -> str:
-    """Compute a hash of the meta card parameters to detect changes."""
-    data = f"{name}|{roll}|{registration_id}|{photo_url}|{status_text}|{registration_date}"
-    return hashlib.md5(data.encode('utf-8')).hexdigest()[:8]
+def _atomic_write(path: str | Path, data: bytes):
+    """Write data to a per-process temp file beside path, then rename it over path.
 
-def generate_meta_card(output_path: Path, name: str, roll: str, registration_id: str, photo_url: str | None, status_text: str, registration_date: str | None = None, site_name: str = "Chayannito 26", force_regenerate: bool = False, cache_dir: Path | None = None) -> bool:
+    Readers (and concurrent workers) only ever see the old or the new file, never a
+    partial one, and an interrupted build leaves no truncated output behind.
+    """
+    tmp = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        # Raw fd: no buffered file object per page
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+@functools.lru_cache(maxsize=16)
+def _file_digest(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+# Fonts drawn on a per-registrant card (see generate_meta_card)
+_CARD_FONTS = ("Inter-Bold.ttf", "Inter-Regular.ttf", "DejaVuSansMono.ttf")
+
+@functools.lru_cache(maxsize=1)
+def _card_assets_digest() -> str:
+    """Digest of what every card shares: this script (the layout code), the logo and
+    the font files _load_font actually resolves to."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_file_digest(__file__))
+    logo = SCRIPT_DIR / "logo.png"
+    if logo.is_file():
+        h.update(_file_digest(str(logo)))
+    for name in _CARD_FONTS:
+        path = getattr(_load_font(name, 24), "path", None)
+        h.update(name.encode("utf-8"))
+        h.update(_file_digest(path) if isinstance(path, str) else b"builtin")
+    return h.hexdigest()
+
+def _avatar_candidates(photo_url: str | None, roll: str, registration_id: str) -> list[str]:
+    """Avatar sources for a card, in the order generate_meta_card tries them."""
+    candidates = []
+    if photo_url:
+        candidates.append(str(photo_url))
+    if roll:
+        candidates.append(f"https://chayannito26.com/college-students/images/{roll}.jpg")
+        candidates.append(str(SCRIPT_DIR / "assets" / f"{roll}.jpg"))
+        candidates.append(str(SCRIPT_DIR / "assets" / f"{roll}.png"))
+    if registration_id:
+        candidates.append(str(SCRIPT_DIR / "assets" / f"{registration_id}.jpg"))
+        candidates.append(str(SCRIPT_DIR / "assets" / f"{registration_id}.png"))
+    return candidates
+
+def _avatar_state(candidates: list[str]) -> str | None:
+    """Identify, from disk alone, the avatar a card would show: the first candidate
+    with a download in AVATAR_CACHE_DIR or an existing local file, tagged with a
+    digest of its bytes ("" if none is available: the card uses initials).
+    Remote candidates whose last fetch failed (see _avatar_known_missing) are passed over.
+
+    Expired downloads count too: revalidating them usually answers 304, and main
+    revalidates them (see _prefetch_avatars) before hashing cards.
+    Returns None when a remote candidate ahead of it has neither, since only the
+    network can tell what the card would show.
+    """
+    for cand in candidates:
+        if cand.lower().startswith("http"):
+            try:
+                data = _avatar_cache_file(cand).read_bytes()
+            except OSError:
+                if _avatar_known_missing(cand):
+                    continue
+                return None
+        else:
+            try:
+                data = Path(cand).read_bytes()
+            except OSError:
+                continue
+        return f"{cand}|{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+    return ""
+
+def _compute_meta_hash(name: str, roll: str, registration_id: str, photo_url: str | None, status_text: str, registration_date: str | None, site_name: str) -> str | None:
+    """Compute a hash of the meta card inputs (content, avatar, fonts, logo and layout code)
+    to detect changes. None if the avatar cannot be identified without the network."""
+    avatar = _avatar_state(_avatar_candidates(photo_url, roll, registration_id))
+    if avatar is None:
+        return None
+    data = f"{name}|{roll}|{registration_id}|{photo_url}|{status_text}|{registration_date}|{site_name}|{avatar}|{_card_assets_digest()}"
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+def _meta_manifest_key(output_path: Path) -> str:
+    """Manifest entry holding a meta image's input hash."""
+    return f"assets/meta/{output_path.name}"
+
+def _card_fields(entry: dict) -> tuple:
+    """A registrant's card content, in generate_meta_card's argument order:
+    (name, roll, registration_id, photo_url, status_text, registration_date)."""
+    get = entry.get
+    return (get("name", "Registrant"), get("roll", ""), get("registration_id", ""), get("photo") or None,
+            _status_for(entry)["status_text"], get("registration_date", ""))
+
+def _meta_card_unchanged(output_path: Path, meta_hash: str | None, hashes: dict) -> bool:
+    """True if output_path exists and was drawn from inputs hashing to meta_hash."""
+    return meta_hash is not None and hashes.get(_meta_manifest_key(output_path)) == meta_hash and output_path.is_file()
+
+# Uncached avatar URLs whose download failed, and hosts whose name did not resolve; not retried for the rest of the build
+_FAILED_URLS: set[str] = set()
+_FAILED_HOSTS: set[str] = set()
+
+def _avatar_cache_file(url: str) -> Path:
+    return AVATAR_CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".bin")
+
+def _avatar_known_missing(url: str) -> bool:
+    """True if fetching url failed without a cached copy less than AVATAR_MAX_AGE ago
+    (its `.miss` marker is fresh); such URLs are not retried until then."""
+    try:
+        return time.time() - _avatar_cache_file(url).with_suffix(".miss").stat().st_mtime < AVATAR_MAX_AGE
+    except OSError:
+        return False
+
+def _fetch_avatar(url: str) -> bytes:
+    """Return the bytes at url, going through a content-addressed on-disk cache.
+
+    Avatars younger than AVATAR_MAX_AGE are served from AVATAR_CACHE_DIR without
+    touching the network. Older ones are revalidated with a conditional GET
+    (If-None-Match / If-Modified-Since from the `.meta` sidecar); a 304 or a
+    network failure keeps the cached bytes. Without a cache entry, network
+    errors propagate to the caller and leave a `.miss` marker, so later builds
+    treat the URL as missing for AVATAR_MAX_AGE instead of fetching it again.
+    """
+    cache_file = _avatar_cache_file(url)
+    meta_file = cache_file.with_suffix(".meta")
+    cached = None
+    try:
+        if time.time() - cache_file.stat().st_mtime < AVATAR_MAX_AGE:
+            return cache_file.read_bytes()
+        cached = cache_file.read_bytes()
+    except OSError:
+        pass
+
+    headers = {"User-Agent": "chayannito26-meta-generator/1.0"}
+    validators = {}
+    if cached is not None:
+        try:
+            validators = _json_loads(meta_file.read_bytes())
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    host = urllib.parse.urlsplit(url).hostname
+    if cached is None and _avatar_known_missing(url):
+        raise URLError("failed in a recent build")
+    try:
+        if cached is None and (url in _FAILED_URLS or host in _FAILED_HOSTS):
+            raise URLError("failed earlier in this build")
+        req = urllib.request.Request(url, headers=headers)
+        with _OPENER.open(req, timeout=6) as resp:
+            data = resp.read()
+            validators = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+    except (HTTPError, URLError, OSError) as e:
+        if cached is None:
+            _FAILED_URLS.add(url)
+            # Only a DNS failure says the host's other avatars would fail too; a timeout
+            # or reset from one request does not
+            if isinstance(getattr(e, "reason", None), socket.gaierror):
+                _FAILED_HOSTS.add(host)
+            try:
+                _ensure_dir(cache_file.parent)
+                _atomic_write(cache_file.with_suffix(".miss"), b"")
+            except OSError:
+                pass
+            raise
+        if isinstance(e, HTTPError) and e.code == 304:
+            log.debug("Avatar not modified: %s", url)
+        else:
+            log.debug("Avatar revalidation failed, using cached copy (%s): %s", url, e)
+        try:
+            os.utime(cache_file)  # fresh again for another AVATAR_MAX_AGE
+        except OSError:
+            pass
+        return cached
+    try:
+        _ensure_dir(cache_file.parent)
+        _atomic_write(meta_file, _json_dumps(validators))
+        _atomic_write(cache_file, data)
+        cache_file.with_suffix(".miss").unlink(missing_ok=True)
+    except OSError as e:
+        console.print(f"[warning]Could not cache avatar {url}: {e}[/warning]")
+    return data
+
+def _prefetch_avatars(registrants: list[dict], max_workers: int = 16, stale_only: bool = False):
+    """Download (or revalidate) remote avatars concurrently into AVATAR_CACHE_DIR.
+
+    Fetches each registrant's first remote avatar candidate (photo, else the roll
+    URL), so rendering reads them from disk instead of waiting on the network one
+    card at a time. Callers pass only registrants whose card will be drawn.
+    With stale_only, instead revalidates every remote candidate that has an
+    expired cache entry and downloads nothing new. Failures are left for
+    rendering to fall back from.
+    """
+    urls = set()
+    for r in registrants:
+        if not r.get("registration_id"):
+            continue
+        candidates = _avatar_candidates(r.get("photo") or None, r.get("roll"), "")
+        if stale_only:
+            urls.update(c for c in candidates if c.lower().startswith("http"))
+        elif candidates and candidates[0].lower().startswith("http"):
+            urls.add(candidates[0])
+
+    def fetch(url):
+        try:
+            if time.time() - _avatar_cache_file(url).stat().st_mtime < AVATAR_MAX_AGE:
+                return
+        except OSError:
+            if stale_only:
+                return
+        try:
+            _fetch_avatar(url)
+        except Exception as e:
+            log.debug("Avatar prefetch failed (%s): %s", url, e)
+
+    if urls:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(fetch, urls))
+
+@functools.lru_cache(maxsize=64)
+def _load_font(name: str, size: int) -> "ImageFont.FreeTypeFont":
+    """Load a meta-card font once per (name, size): prefer Inter in assets, fall back to DejaVu or default."""
+    try:
+        return ImageFont.truetype(str(SCRIPT_DIR / "assets" / name), size)
+    except Exception:
+        try:
+            return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+        except Exception:
+            return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=4096)
+def _text_width(font, text: str) -> float:
+    """Advance width of text in font; fonts come from _load_font, so they are stable cache keys."""
+    return font.getlength(text)
+
+def _wrap_lines(text: str, font, max_width: float) -> list[str]:
+    """Greedy word wrap. Tracks the running line width from cached per-word widths
+    instead of re-measuring the whole candidate line for every word."""
+    space_w = _text_width(font, " ")
+    lines = []
+    cur = []
+    cur_w = 0.0
+    for w in text.split():
+        w_w = _text_width(font, w)
+        if not cur:
+            cur, cur_w = [w], w_w
+        elif cur_w + space_w + w_w <= max_width:
+            cur.append(w)
+            cur_w += space_w + w_w
+        else:
+            lines.append(" ".join(cur))
+            cur, cur_w = [w], w_w
+    if cur:
+        lines.append(" ".join(cur))
+    return lines
+
+_AVATAR_SIZE = 300
+
+@functools.lru_cache(maxsize=4)
+def _avatar_mask(size: int = _AVATAR_SIZE) -> "Image.Image":
+    """Circular alpha mask for a size x size avatar, rasterized once per size and shared by every card."""
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
+    return mask
+
+@functools.lru_cache(maxsize=64)
+def _load_avatar(source: str) -> "Image.Image | None":
+    """Decode one avatar candidate (URL or local path), center-crop it to a square
+    and resize it to _AVATAR_SIZE. Returns None if a local file does not exist.
+
+    Cached per process, so registrants sharing a photo (e.g. the placeholder) decode
+    it once; callers only paste the result and must not modify it.
+    """
+    if source.lower().startswith("http"):
+        log.debug("Attempting remote avatar: %s", source)
+        avatar = Image.open(BytesIO(_fetch_avatar(source)))
+    else:
+        cpath = Path(source)
+        log.debug("Attempting local avatar: %s", cpath)
+        if not cpath.is_file():
+            return None
+        avatar = Image.open(cpath)
+    # Large JPEGs decode straight at a reduced DCT scale (still >= 2x the target); no-op for other formats
+    avatar.draft("RGB", (_AVATAR_SIZE * 2, _AVATAR_SIZE * 2))
+    avatar = avatar.convert("RGBA")
+    log.debug("Loaded avatar: %s", source)
+    # center-crop to square if needed
+    aw, ah = avatar.size
+    side = min(aw, ah)
+    if aw != ah:
+        left = (aw - side) // 2
+        top = (ah - side) // 2
+        avatar = avatar.crop((left, top, left + side, top + side))
+    # Cheap box-average down to within 2x of the target so LANCZOS only filters the last step
+    factor = side // (_AVATAR_SIZE * 2)
+    if factor > 1:
+        avatar = avatar.reduce(factor)
+    return avatar.resize((_AVATAR_SIZE, _AVATAR_SIZE), Image.LANCZOS)
+
+@functools.lru_cache(maxsize=4)
+def _base_canvas(site_name: str) -> "Image.Image":
+    """The per-card constant layer: canvas background, rounded white card, site logo
+    and site label.
+
+    Built once per process (per site name); callers draw on a .copy().
+    """
+    W, H, margin = 1200, 630, 48
+    img = Image.new("RGB", (W, H), color=(249, 250, 251))  # light gray canvas
+    ImageDraw.Draw(img).rounded_rectangle((margin, margin, W - margin, H - margin), radius=24, fill=(255, 255, 255))
+    # Site logo: small, at the top-left of the card if available
+    try:
+        logo_path = SCRIPT_DIR / "logo.png"
+        if logo_path.is_file():
+            logo = Image.open(logo_path).convert("RGBA")
+            logo.thumbnail((96, 96), Image.LANCZOS)
+            img.paste(logo, (margin + 20, margin + 20), logo)
+    except Exception:
+        pass
+    # Site label, at the top of the text column (right of the avatar)
+    text_x = margin + 48 + _AVATAR_SIZE + 64
+    ImageDraw.Draw(img).text((text_x, margin + 48), site_name, font=_load_font("Inter-Regular.ttf", 24), fill=(75, 85, 99))
+    return img
+
+def generate_meta_card(output_path: Path, name: str, roll: str, registration_id: str, photo_url: str | None, status_text: str, registration_date: str | None = None, site_name: str = SITE_NAME, force_regenerate: bool = False, cache_dir: Path | None = None, image_format: str = "png", hashes: dict | None = None, meta_hash: str | None = None) -> bool:
     """Generate a social-preview card (1200x630) showing the registrant's name, avatar, roll, registration id and registration date.
     Uses robust text measurement via draw.textbbox. Returns True on success.
+    Requires Pillow; callers check PIL_AVAILABLE.
     
     Args:
-        output_path: Where to save the generated image
+        output_path: Where to save the generated image; its directory must exist
         name, roll, registration_id, photo_url, status_text, registration_date: Card content
         site_name: Site name to display
         force_regenerate: If True, regenerate even if cached version exists
         cache_dir: Directory containing cached meta images (usually repo root meta_images/)
+        image_format: "png" or "webp"
+        hashes: Input hashes of previously generated cards (the build manifest); read
+            to skip unchanged cards and updated for this one
+        meta_hash: This card's input hash, if the caller already computed it
+            (see _compute_meta_hash); otherwise computed here
     """
+    if hashes is None:
+        hashes = {}
     try:
-        if not PIL_AVAILABLE:
-            console.print("[warning]Pillow not available — skipping meta image generation[/warning]")
-            return False
-        
         # Check if we can use a cached version from the repo
         if cache_dir and not force_regenerate:
             cache_file = cache_dir / output_path.name
             if cache_file.is_file():
-                # Copy cached version to output
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(cache_file, output_path)
-                console.print(f"[success]Using cached meta image: {cache_file.name}[/success]")
+                # Copy cached version to output (output_path.parent is created by the caller);
+                # skipped when the output is already an unmodified copy from a previous build
+                if _fast_copy(cache_file, output_path):
+                    log.debug("Using cached meta image: %s", cache_file.name)
+                else:
+                    log.debug("Unchanged meta image: %s", output_path.name)
                 return True
 
-        from io import BytesIO
-        import urllib.request
+        # Skip re-rendering when the existing output was built from the same inputs
+        if meta_hash is None and not force_regenerate:
+            meta_hash = _compute_meta_hash(name, roll, registration_id, photo_url, status_text, registration_date, site_name)
+        hash_key = _meta_manifest_key(output_path)
+        if not force_regenerate and _meta_card_unchanged(output_path, meta_hash, hashes):
+            log.debug("Unchanged meta image: %s", output_path.name)
+            return True
 
         W, H = 1200, 630
-        background = (249, 250, 251)  # light gray canvas
-        card_bg = (255, 255, 255)
         accent = (16, 185, 129)  # emerald
         text_dark = (17, 24, 39)
         text_muted = (75, 85, 99)
 
-        img = Image.new("RGB", (W, H), color=background)
+        # Background, card, logo and site label come pre-rendered
+        img = _base_canvas(site_name).copy()
         draw = ImageDraw.Draw(img)
-
-        # Card area
         margin = 48
-        card_rect = (margin, margin, W - margin, H - margin)
-        draw.rounded_rectangle(card_rect, radius=24, fill=card_bg)
-
-        # Fonts: prefer Inter in assets, fall back to DejaVu or default
-        def load_font(name, size):
-            try:
-                p = SCRIPT_DIR / "assets" / name
-                return ImageFont.truetype(str(p), size)
-            except Exception:
-                try:
-                    return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
-                except Exception:
-                    return ImageFont.load_default()
 
         # Larger, more legible fonts for social preview
-        name_font = load_font("Inter-Bold.ttf", 64)
-        meta_font = load_font("Inter-Regular.ttf", 32)
-        small_font = load_font("Inter-Regular.ttf", 24)
-        mono_font = load_font("DejaVuSansMono.ttf", 28)
+        name_font = _load_font("Inter-Bold.ttf", 64)
+        meta_font = _load_font("Inter-Regular.ttf", 32)
+        small_font = _load_font("Inter-Regular.ttf", 24)
+        mono_font = _load_font("DejaVuSansMono.ttf", 28)
 
     # Avatar: larger and vertically centered in the card area so the text can use more space
-        avatar_size = 300
+        avatar_size = _AVATAR_SIZE
         avatar_x = margin + 48
         inner_h = H - margin * 2
         avatar_y = margin + (inner_h - avatar_size) // 2
 
         avatar = None
-        # Build prioritized avatar candidate list
-        candidates = []
-        if photo_url:
-            candidates.append(str(photo_url))
-        if roll:
-            candidates.append(f"https://chayannito26.com/college-students/images/{roll}.jpg")
-            candidates.append(str(SCRIPT_DIR / "assets" / f"{roll}.jpg"))
-            candidates.append(str(SCRIPT_DIR / "assets" / f"{roll}.png"))
-        if registration_id:
-            candidates.append(str(SCRIPT_DIR / "assets" / f"{registration_id}.jpg"))
-            candidates.append(str(SCRIPT_DIR / "assets" / f"{registration_id}.png"))
-
-        from io import BytesIO
-        import urllib.request
-        from urllib.error import HTTPError, URLError
-
-        # Prepare optional SSL context using certifi if available (fix local SSL verification in some envs)
-        ssl_context = None
-        try:
-            import ssl, certifi
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-        except Exception:
-            ssl_context = None
-
+        candidates = _avatar_candidates(photo_url, roll, registration_id)
         for cand in candidates:
             if not cand:
                 continue
             try:
-                if cand.lower().startswith("http"):
-                    console.print(f"[info]Attempting remote avatar: {cand}[/info]")
-                    req = urllib.request.Request(cand, headers={"User-Agent": "chayannito26-meta-generator/1.0"})
-                    if ssl_context:
-                        with urllib.request.urlopen(req, timeout=6, context=ssl_context) as resp:
-                            data = resp.read()
-                    else:
-                        with urllib.request.urlopen(req, timeout=6) as resp:
-                            data = resp.read()
-                    avatar = Image.open(BytesIO(data)).convert("RGBA")
-                    console.print(f"[success]Loaded remote avatar: {cand}[/success]")
+                avatar = _load_avatar(cand)
+                if avatar is not None:
                     break
-                else:
-                    cpath = Path(cand)
-                    console.print(f"[info]Attempting local avatar: {cpath}[/info]")
-                    if cpath.is_file():
-                        avatar = Image.open(cpath).convert("RGBA")
-                        console.print(f"[success]Loaded local avatar: {cpath}[/success]")
-                        break
             except (HTTPError, URLError) as e:
-                console.print(f"[warning]Remote avatar failed ({cand}): {e}[/warning]")
-                avatar = None
+                log.debug("Remote avatar failed (%s): %s", cand, e)
             except Exception as e:
-                console.print(f"[warning]Avatar candidate error ({cand}): {e}[/warning]")
-                avatar = None
-
-        # center-crop to square if needed
-        if avatar:
-            aw, ah = avatar.size
-            if aw != ah:
-                side = min(aw, ah)
-                left = (aw - side) // 2
-                top = (ah - side) // 2
-                avatar = avatar.crop((left, top, left + side, top + side))
-
-        if avatar:
-            # Resize and crop to square (already center-cropped above), then resize
-            avatar = avatar.resize((avatar_size, avatar_size), Image.LANCZOS)
-            # Make circular mask and paste with alpha to preserve edges
-            mask = Image.new("L", (avatar_size, avatar_size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.ellipse((0, 0, avatar_size, avatar_size), fill=255)
-            if avatar.mode != "RGBA":
-                avatar = avatar.convert("RGBA")
-            img.paste(avatar, (avatar_x, avatar_y), mask)
+                log.debug("Avatar candidate error (%s): %s", cand, e)
+
+        if avatar is not None:
+            # Paste through the shared circular mask to preserve edges
+            img.paste(avatar, (avatar_x, avatar_y), _avatar_mask(avatar_size))
         else:
             # Draw placeholder circle with initials
             circle_bbox = (avatar_x, avatar_y, avatar_x + avatar_size, avatar_y + avatar_size)
             draw.ellipse(circle_bbox, fill=accent)
             # initials (use a font sized relative to avatar)
             initials = "".join([p[0].upper() for p in (name or "").split()[:2]]) or "?"
-            initials_font = load_font("Inter-Bold.ttf", max(48, avatar_size // 4))
+            initials_font = _load_font("Inter-Bold.ttf", max(48, avatar_size // 4))
             ib = draw.textbbox((0, 0), initials, font=initials_font)
             iw = ib[2] - ib[0]
             ih = ib[3] - ib[1]
             draw.text((avatar_x + (avatar_size - iw) / 2, avatar_y + (avatar_size - ih) / 2), initials, font=initials_font, fill=(255, 255, 255))
 
-        # Site logo: try to include a small logo at the top-left of the card if available
-        try:
-            logo_path = SCRIPT_DIR / "logo.png"
-            if logo_path.is_file():
-                logo = Image.open(logo_path).convert("RGBA")
-                # small logo size
-                lsize = 96
-                logo.thumbnail((lsize, lsize), Image.LANCZOS)
-                # paste with a small margin inside the card
-                logo_x = margin + 20
-                logo_y = margin + 20
-                img.paste(logo, (logo_x, logo_y), logo)
-        except Exception:
-            pass
-
         # Text area start (use more horizontal space)
         text_x = avatar_x + avatar_size + 64
         text_max_w = W - margin - text_x - 48
 
-        # Site label (positioned near top of card area but allow more vertical breathing room)
-        site_label = site_name
-        draw.text((text_x, margin + 48), site_label, font=small_font, fill=text_muted)
-
         # Name (wrap if necessary)
-        def wrap_lines(text, font, max_width):
-            words = text.split()
-            lines = []
-            cur = []
-            for w in words:
-                test = " ".join(cur + [w])
-                bbox = draw.textbbox((0, 0), test, font=font)
-                if bbox[2] - bbox[0] <= max_width:
-                    cur.append(w)
-                else:
-                    if cur:
-                        lines.append(" ".join(cur))
-                    cur = [w]
-            if cur:
-                lines.append(" ".join(cur))
-            return lines
-
-        name_lines = wrap_lines(name or "Registrant", name_font, text_max_w)
+        name_lines = _wrap_lines(name or "Registrant", name_font, text_max_w)
         # Start the name a bit lower so the block occupies the center-left area
         y = margin + inner_h // 4
         for line in name_lines[:4]:
@@ -448,14 +753,37 @@ def generate_meta_card(output_path: Path, name: str, roll: str, registration_id:
             draw.text((text_x, pill_y + rh + 18), date_text, font=small_font, fill=text_muted)
 
         # Save
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(output_path, format="PNG")
-        console.print(f":white_check_mark: Generated meta image [path]{output_path}[/path]")
+        if image_format == "webp":
+            img.save(output_path, format="WEBP", quality=85, method=4)
+        else:
+            # Level 1 Deflate: several times faster than the default 6 for a slightly larger card
+            img.save(output_path, format="PNG", optimize=False, compress_level=1)
+        # The avatar was unknown before the draw, so drawing fetched it (or marked it
+        # missing): key on it as it is on disk now. Should it still be unknown, leave no
+        # key, so the next build retries it instead of keeping initials
+        if meta_hash is None:
+            meta_hash = _compute_meta_hash(name, roll, registration_id, photo_url, status_text, registration_date, site_name)
+        if meta_hash is None:
+            hashes.pop(hash_key, None)
+        else:
+            hashes[hash_key] = meta_hash
+        log.debug("Generated meta image %s", output_path)
         return True
     except Exception as e:
         console.print(f"[warning]Failed to generate meta card:[/warning] {e}")
         return False
 
+# One master-list table row: link, registration_id, link, name, roll, roll, registration_date, ref_cell
+_MASTER_ROW = """
+        <tr class="clickable-row" data-href="%s">
+            <td class="reg-id-cell"><div class="reg-id-main">%s</div></td>
+            <td class="name-cell"><div class="name-secondary"><a href="%s">%s</a></div></td>
+            <td class="roll-cell" data-full-roll="%s">%s</td>
+            <td class="date-cell">%s</td>
+            <td class="desktop-only">%s</td>
+        </tr>
+        """
+
 def render_master_list(registrants, links, ref_cells, stats: dict) -> str:
     """Create the master_list.html content with Tailwind styling.
 
@@ -463,22 +791,18 @@ def render_master_list(registrants, links, ref_cells, stats: dict) -> str:
     placed in its own cell so that dividers can be applied when sorting by that
     column; Name is a normal sortable column.
     """
-    rows = []
-    for (reg, link, ref_cell) in zip(registrants, links, ref_cells):
-        rows.append(f"""
-        <tr class="clickable-row" data-href="{link}">
-            <td class="reg-id-cell"><div class="reg-id-main">{reg['registration_id']}</div></td>
-            <td class="name-cell"><div class="name-secondary"><a href="{link}">{reg['name']}</a></div></td>
-            <td class="roll-cell" data-full-roll="{reg['roll']}">{reg['roll']}</td>
-            <td class="date-cell">{reg['registration_date']}</td>
-            <td class="desktop-only">{ref_cell}</td>
-        </tr>
-        """)
-    rows_html = "\n".join(rows)
+    # Rows stream into one buffer (newline-separated) rather than a list of row strings
+    buf = StringIO()
+    write = buf.write
+    sep = ""
+    for reg, link, ref_cell in zip(registrants, links, ref_cells):
+        write(sep)
+        write(_MASTER_ROW % (link, reg['_id_h'], link, reg['_name_h'], reg['_roll_h'], reg['_roll_h'], reg['_date_h'], ref_cell))
+        sep = "\n"
+    rows_html = buf.getvalue()
 
     stats_html = f"""
-    <!-- Desktop & Tablet Card View -->
-    <div class="stats-cards-grid">
+    <div class="stats-grid">
         <div class="stat-card">
             <h3>Science</h3>
             <p><span>Boys:</span> <strong>{stats['science_boys']}</strong></p>
@@ -504,426 +828,106 @@ def render_master_list(registrants, links, ref_cells, stats: dict) -> str:
             <p class="total"><span>Grand Total:</span> <strong>{stats['total']}</strong></p>
         </div>
     </div>
-
-    <!-- Mobile Compact Column View -->
-    <div class="stats-compact-mobile">
-        <div class="stat-column">
-            <h3>Science</h3>
-            <p><span>Boys:</span> <strong>{stats['science_boys']}</strong></p>
-            <p><span>Girls:</span> <strong>{stats['science_girls']}</strong></p>
-            <p class="total"><span>Total:</span> <strong>{stats['total_science']}</strong></p>
-        </div>
-        <div class="stat-column">
-            <h3>Arts</h3>
-            <p><span>Boys:</span> <strong>{stats['arts_boys']}</strong></p>
-            <p><span>Girls:</span> <strong>{stats['arts_girls']}</strong></p>
-            <p class="total"><span>Total:</span> <strong>{stats['total_arts']}</strong></p>
-        </div>
-        <div class="stat-column">
-            <h3>Commerce</h3>
-            <p><span>Boys:</span> <strong>{stats['commerce_boys']}</strong></p>
-            <p><span>Girls:</span> <strong>{stats['commerce_girls']}</strong></p>
-            <p class="total"><span>Total:</span> <strong>{stats['total_commerce']}</strong></p>
-        </div>
-        <div class="stat-column summary">
-            <h3>Summary</h3>
-            <p><span>Total Boys:</span> <strong>{stats['total_boys']}</strong></p>
-            <p><span>Total Girls:</span> <strong>{stats['total_girls']}</strong></p>
-            <p class="total"><span>Grand Total:</span> <strong>{stats['total']}</strong></p>
-        </div>
-    </div>
     """
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-  <title>Master Verified List</title>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-  <style>
-    /* Chayannito 26 Master List Styles */
-    * {{ box-sizing: border-box; }}
-    body {{ font-family: 'Inter', sans-serif; margin: 0; padding: 0; background-color: #f3f4f6; min-height: 100vh; }}
-    
-    @media (min-width: 768px) {{
-        body {{ padding: 2rem; }}
-    }}
+    return _fill_template(_master_template(), {"stats_html": stats_html, "rows_html": rows_html, "total": len(registrants)})
 
-    /* Mobile-first: Hide desktop cards by default */
-    .stats-cards-grid {{ display: none; }}
-    
-    /* Mobile Compact Column Styles */
-    .stats-compact-mobile {{ max-width: 80rem; margin: 0 auto 2rem auto; background-color: #ffffff; border-radius: 1rem; padding: 1rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06); border: 1px solid #e5e7eb; display: flex; flex-direction: column; gap: 0.75rem; }}
-    .stats-compact-mobile .stat-column {{ padding-bottom: 0.75rem; border-bottom: 1px solid #e5e7eb; }}
-    .stats-compact-mobile .stat-column:last-child {{ border-bottom: none; padding-bottom: 0; }}
-    .stats-compact-mobile h3 {{ margin: 0 0 0.5rem; font-size: 1rem; font-weight: 700; color: #1f2937; }}
-    .stats-compact-mobile p {{ margin: 0.25rem 0; display: flex; justify-content: space-between; font-size: 0.875rem; }}
-    .stats-compact-mobile p span {{ color: #6b7280; }}
-    .stats-compact-mobile p strong {{ color: #111827; font-weight: 600; }}
-    .stats-compact-mobile p.total {{ margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #f3f4f6; font-weight: 700; }}
-    .stats-compact-mobile .summary h3 {{ color: #065f46; }}
-
-    /* Tablet & Desktop Styles (min-width: 768px) */
-    @media (min-width: 768px) {{
-        .stats-compact-mobile {{ display: none; }} /* Hide mobile view */
-        /* Tablet: keep two cards per row for comfortable reading */
-        .stats-cards-grid {{ display: grid; max-width: 80rem; margin: 0 auto 2rem auto; grid-template-columns: repeat(2, 1fr); gap: 1.5rem; }}
-        .stat-card {{ background-color: #ffffff; border-radius: 1rem; padding: 1.5rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06); border: 1px solid #e5e7eb; }}
-        .stat-card h3 {{ margin: 0 0 1rem; font-size: 1.25rem; font-weight: 700; color: #1f2937; }}
-        .stat-card p {{ margin: 0.5rem 0; display: flex; justify-content: space-between; font-size: 0.9rem; color: #4b5563; }}
-        .stat-card p span {{ color: #6b7280; }}
-        .stat-card p strong {{ color: #111827; font-weight: 600; }}
-        .stat-card p.total {{ margin-top: 1rem; padding-top: 0.75rem; border-top: 1px solid #f3f4f6; font-weight: 700; }}
-        .stat-card.summary {{ border-color: #10b981; background-color: #f0fdf4; }}
-        .stat-card.summary h3 {{ color: #065f46; }}
-    }}
-    /* Large desktop: allow more columns so cards can spread out */
-    @media (min-width: 1200px) {{
-        .stats-cards-grid {{ grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); }}
-    }}
-
-    .container {{ background-color: #ffffff; }}
-    @media (min-width: 768px) {{
-        .container {{ max-width: 80rem; margin-left: auto; margin-right: auto; box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05); border-radius: 1rem; overflow: hidden; }}
-    }}
-
-    .header {{ padding: 1rem; border-bottom: 1px solid #e5e7eb; display: flex; align-items: center; justify-content: space-between; }}
-    @media (min-width: 768px) {{
-        .header {{ padding-left: 1.5rem; padding-right: 1.5rem; padding-top: 1rem; padding-bottom: 1rem; }}
-    }}
-    .header h1 {{ font-size: 1.25rem; line-height: 1.75rem; font-weight: 700; color: #334155; margin: 0; }}
-     @media (min-width: 768px) {{
-        .header h1 {{ font-size: 1.5rem; line-height: 2rem; }}
-    }}
-    .header-right {{ display: flex; align-items: center; gap: 0.75rem; }}
-    .header-right span {{ font-size: 0.875rem; line-height: 1.25rem; color: #6b7280; }}
-    
-    .table-container {{ overflow-x: auto; }}
-    .table {{ width: 100%; border-collapse: separate; border-spacing: 0; }}
-    .table thead {{ background-color: #dcfce7; }}
-    .table th {{ padding: 0.75rem 0.5rem; text-align: left; font-size: 0.75rem; line-height: 1rem; font-weight: 700; color: #166534; text-transform: uppercase; letter-spacing: 0.05em; }}
-    .table td {{ padding: 0.75rem 0.5rem; }}
-    
-    @media (min-width: 768px) {{
-        .table th {{ padding: 0.75rem 1.5rem; }}
-        .table td {{ padding: 1rem 1.5rem; }}
-    }}
-
-    .table tbody {{ background-color: #ffffff; }}
-    .table tbody tr {{ border-top: 1px solid #f3f4f6; }}
-    @media (min-width: 768px) {{
-        .table tbody tr:hover {{ background-color: #f0fdf4; }}
-    }}
-
-    .reg-id-main {{
-        font-family: ui-monospace, SFMono-Regular, "SF Mono", Monaco, Inconsolata, "Roboto Mono", monospace;
-        font-weight: 600;
-        color: #166534;
-    }}
-    .name-secondary {{
-        font-size: 0.875rem;
-        color: #4b5563;
-        margin-top: 0.125rem;
-    }}
-    .name-secondary a {{ color: #16a34a; text-decoration: none; }}
-    .name-secondary a:hover {{ text-decoration: underline; }}
-
-    @media (min-width: 768px) {{
-        /* Show registration id in its own column on desktop */
-        .reg-id-main {{ display: inline-block; font-size: 0.875rem; margin-top: 0; color: #164e2e; }}
-        .name-secondary {{ font-size: 1rem; margin-top: 0; }}
-        .name-secondary a {{ color: #1f2937; font-weight: 600; }}
-    }}
-
-    .desktop-only {{ display: none; }}
-    @media (min-width: 768px) {{
-        .desktop-only {{ display: table-cell; }}
-    }}
-
-    @media (min-width: 768px) {{
-        /* Name links live in the second column */
-        .table td:nth-child(2) a {{ color: #16a34a; text-decoration: none; }}
-        .table td:nth-child(2) a:hover {{ text-decoration: underline; }}
-
-        /* Roll shows muted text */
-        .table td:nth-child(3) {{ color: #4b5563; }}
-
-        /* Date column uses monospace and an accent color for clarity */
-        .table td:nth-child(4) {{ font-family: ui-monospace, SFMono-Regular, "SF Mono", Monaco, Inconsolata, "Roboto Mono", monospace; font-size: 0.875rem; line-height: 1.25rem; color: #166534; }}
-    }}
-
-    /* Referred-by (desktop-only) is the 5th column */
-    .table td:nth-child(5) a {{ color: #16a34a; text-decoration: none; }}
-    .table td:nth-child(5) a:hover {{ text-decoration: underline; }}
-    .table td:nth-child(5) span {{ color: #1f2937; font-weight: 600; }}
-    .table th.sortable {{ cursor: pointer; user-select: none; }}
-    .sort-indicator {{ margin-left: 0.5rem; font-size: 0.75rem; color: #166534; opacity: 0.8; }}
-    /* Divider rows for grouped Registration ID sections */
-    .divider-row td {{
-        background-color: #ecfdf5;
-        color: #065f46;
-        font-weight: 800;
-        text-transform: uppercase;
-        letter-spacing: 0.04em;
-        padding-top: 0.75rem;
-        padding-bottom: 0.75rem;
-        border-top: 3px solid #10b981;
-    }}
-    .footer {{ text-align: center; margin-top: 2rem; font-size: 0.75rem; line-height: 1rem; color: #9ca3af; }}
-  </style>
-</head>
-<body>
-    {stats_html}
-    <div class="container">
-        <div class="header">
-            <div style="display:flex; align-items:center; gap:0.75rem;">
-                <img src="/assets/logo.png" alt="logo" style="width:48px; height:48px; object-fit:contain; border-radius:6px;" onerror="this.style.display='none'">
-                <h1>Chayannito 26 Master Verified List</h1>
-            </div>
-            <div class="header-right">
-                <span>Total: {len(registrants)}</span>
-        
-      </div>
-    </div>
-    <div class="table-container">
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th data-type="string" data-key="registration_id">Reg. ID <span class="sort-indicator"></span></th>
-                        <th data-type="string" data-key="name">Name <span class="sort-indicator"></span></th>
-                        <th data-type="string" data-key="roll">Roll <span class="sort-indicator"></span></th>
-                        <th data-type="date" data-key="registration_date">Date <span class="sort-indicator"></span></th>
-                        <th class="desktop-only" data-type="string" data-key="referred_by">Referred By <span class="sort-indicator"></span></th>
-                    </tr>
-                </thead>
-        <tbody>
-          {rows_html}
-        </tbody>
-      </table>
-    </div>
-  </div>
-  <footer class="footer">
-    Generated automatically
-  </footer>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            const table = document.querySelector('.table');
-            if (!table) return;
-            const tbody = table.querySelector('tbody');
-            const headers = table.querySelectorAll('th');
-            let sortState = {{ index: null, asc: true }};
-
-                function clearDividers() {{
-                    tbody.querySelectorAll('tr.divider-row').forEach(r => r.remove());
-                }}
-
-                function titleForKey(key) {{
-                    const parts = (key || '').toLowerCase().split('-');
-                    const stream = parts[0] || '';
-                    const gender = parts[1] || '';
-                    const streamTitle = stream === 'sc' ? 'Science' : stream === 'ar' ? 'Arts' : stream === 'co' ? 'Commerce' : 'Unknown';
-                    const genderTitle = gender === 'b' ? 'Boys' : gender === 'g' ? 'Girls' : '';
-                    return genderTitle ? `${{streamTitle}} - ${{genderTitle}}` : streamTitle;
-                }}
-
-                function applyRegIdDividers(rows) {{
-                    clearDividers();
-                    let lastKey = null;
-                    rows.forEach(row => {{
-                        // Prefer the reg-id cell, fall back to the inner reg-id-main element
-                        const cell = row.querySelector('.reg-id-cell') || row.querySelector('.reg-id-main');
-                        const txt = cell ? cell.textContent.trim().toLowerCase() : '';
-                        const parts = txt.split('-');
-                        const key = parts.length >= 2 ? `${{parts[0]}}-${{parts[1]}}` : '';
-                        if (key && key !== lastKey) {{
-                            const tr = document.createElement('tr');
-                            tr.className = 'divider-row';
-                            const td = document.createElement('td');
-                            td.colSpan = headers.length;
-                            td.textContent = titleForKey(key);
-                            tr.appendChild(td);
-                            tbody.insertBefore(tr, row);
-                            lastKey = key;
-                        }}
-                    }});
-                }}
-
-                function applyRollDividers(rows) {{
-                    clearDividers();
-                    let lastGroup = null;
-                    rows.forEach(row => {{
-                        const cell = row.querySelector('.roll-cell');
-                        const txt = cell ? cell.getAttribute('data-full-roll') || cell.textContent.trim() : '';
-                        let groupChar = '';
-                        // Try 9th char (index 8), fall back to 10th (index 9)
-                        if (txt && txt.length > 8) groupChar = txt.charAt(8);
-                        if (!groupChar && txt && txt.length > 9) groupChar = txt.charAt(9);
-                        const group = groupChar === '1' ? 'Science' : groupChar === '2' ? 'Arts' : groupChar === '3' ? 'Commerce' : 'Unknown';
-                        if (group && group !== lastGroup) {{
-                            const tr = document.createElement('tr');
-                            tr.className = 'divider-row';
-                            const td = document.createElement('td');
-                            td.colSpan = headers.length;
-                            td.textContent = group;
-                            tr.appendChild(td);
-                            tbody.insertBefore(tr, row);
-                            lastGroup = group;
-                        }}
-                    }});
-                }}
-
-            headers.forEach((th, index) => {{
-                if (th.offsetParent === null) return; // Skip hidden headers
-                th.classList.add('sortable');
-                th.setAttribute('data-index', index);
-                const indicator = th.querySelector('.sort-indicator');
-                th.addEventListener('click', () => {{
-                    clearDividers();
-                    const type = th.getAttribute('data-type') || 'string';
-                    const asc = (sortState.index === index) ? !sortState.asc : true;
-                    sortState = {{ index, asc }};
-                    const rows = Array.from(tbody.querySelectorAll('tr:not(.divider-row)'));
-                    rows.sort((a, b) => {{
-                        const aCellNode = a.children[index];
-                        const bCellNode = b.children[index];
-                        
-                        let aCell = '';
-                        let bCell = '';
-                        if (aCellNode) {{
-                            const regElemA = (aCellNode.querySelector && aCellNode.querySelector('.reg-id-main')) || null;
-                            aCell = regElemA ? regElemA.textContent.trim() : aCellNode.textContent.trim();
-                        }}
-                        if (bCellNode) {{
-                            const regElemB = (bCellNode.querySelector && bCellNode.querySelector('.reg-id-main')) || null;
-                            bCell = regElemB ? regElemB.textContent.trim() : bCellNode.textContent.trim();
-                        }}
-
-                        if (type === 'date') {{
-                            const aTime = Date.parse(aCell) || 0;
-                            const bTime = Date.parse(bCell) || 0;
-                            return asc ? aTime - bTime : bTime - aTime;
-                        }}
-                        const aNum = parseFloat(aCell.replace(/[^0-9.-]+/g, ''));
-                        const bNum = parseFloat(bCell.replace(/[^0-9.-]+/g, ''));
-                        const aIsNum = !isNaN(aNum);
-                        const bIsNum = !isNaN(bNum);
-                        if (aIsNum && bIsNum) {{
-                            return asc ? aNum - bNum : bNum - aNum;
-                        }}
-                        return asc
-                            ? aCell.localeCompare(bCell, undefined, {{ numeric: true, sensitivity: 'base' }})
-                            : bCell.localeCompare(aCell, undefined, {{ numeric: true, sensitivity: 'base' }});
-                    }});
-                    // Re-append rows in new order
-                    rows.forEach(r => tbody.appendChild(r));
-                    // Update indicators
-                    headers.forEach(h => {{
-                        const ind = h.querySelector('.sort-indicator');
-                        if (ind) ind.textContent = '';
-                    }});
-                    if (indicator) indicator.textContent = asc ? '▲' : '▼';
-
-                    // If sorting by Registration ID or Roll, add dividers
-                    const key = th.getAttribute('data-key');
-                    if (key === 'registration_id') {{
-                        applyRegIdDividers(rows);
-                    }} else if (key === 'roll') {{
-                        applyRollDividers(rows);
-                    }}
-                }});
-            }});
-
-            // Make rows clickable on mobile
-            tbody.addEventListener('click', function(e) {{
-                if (window.innerWidth >= 768) return; // Only on mobile
-                
-                // Don't interfere with clicks on links
-                if (e.target.tagName === 'A') return;
-
-                const row = e.target.closest('.clickable-row');
-                if (row && row.dataset.href) {{
-                    window.location.href = row.dataset.href;
-                }}
-            }});
-
-            // Update roll cells to show last 5 chars on tablet/mobile (<=1024px)
-            function updateRollCells() {{
-                const width = window.innerWidth || document.documentElement.clientWidth;
-                document.querySelectorAll('.roll-cell').forEach(td => {{
-                    const full = td.getAttribute('data-full-roll') || td.textContent || '';
-                    if (width < 768) {{
-                        td.textContent = full.length > 5 ? '...' + full.slice(-5) : full;
-                    }} else {{
-                        td.textContent = full;
-                    }}
-                }});
-            }}
-
-            updateRollCells();
-            window.addEventListener('resize', updateRollCells);
-            window.addEventListener('orientationchange', updateRollCells);
-        }});
-    </script>
-</body>
-</html>"""
-
-def write_if_changed(path: Path, content: str) -> bool:
-    """Write only if content differs. Returns True if written."""
-    if path.exists():
-        try:
-            old = path.read_text(encoding="utf-8")
-            if old == content:
-                console.print(f"Unchanged: [path]{path}[/path]", style="warning")
+def _content_hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def _load_manifest(out_dir: Path) -> dict:
+    """Load the {filename: hash} manifest (pages, and meta images under assets/meta/) left by the previous build, or {}."""
+    try:
+        manifest = _json_loads((out_dir / MANIFEST_NAME).read_bytes())
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(out_dir: Path, manifest: dict):
+    _atomic_write(out_dir / MANIFEST_NAME, _json_dumps(manifest))
+
+def write_if_changed(path: str | Path, content: bytes, manifest: dict | None = None) -> bool:
+    """Write UTF-8 encoded content only if it differs. Returns True if written.
+
+    With a manifest (filename -> content hash from the previous build), a page
+    whose hash matches is skipped without reading it back; the manifest entry is
+    updated either way.
+    """
+    if manifest is not None:
+        digest = _content_hash(content)
+        name = os.path.basename(path)
+        known = manifest.get(name)
+        manifest[name] = digest
+        if known == digest and os.path.exists(path):
+            log.debug("Unchanged: %s", path)
+            return False
+    try:
+        with open(path, "rb") as f:
+            if f.read() == content:
+                log.debug("Unchanged: %s", path)
                 return False
-        except Exception as e:
-            console.print(f"[warning]Could not read existing file[/warning] [path]{path}[/path]: {e}")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    console.print(f":white_check_mark: [success]Wrote[/success] [path]{path}[/path]")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        console.print(f"[warning]Could not read existing file[/warning] [path]{path}[/path]: {e}")
+    _ensure_dir(os.path.dirname(path))
+    _atomic_write(path, content)
+    log.debug("Wrote %s", path)
     return True
 
 # ---- Referral helpers ----
 def _build_indexes(registrants):
-    by_id = {}
-    by_roll = {}
-    by_name = {}
+    """Map registration IDs, rolls and lowercased names to registrants in a single pass.
+
+    On a key clash the ID wins over the roll and the roll over the name, which is
+    the order _resolve_referer used to try them in.
+    """
+    by_id, by_roll, by_name = {}, {}, {}
     for r in registrants:
-        rid = r.get("registration_id")
+        get = r.get
+        rid, roll, name = get("registration_id"), get("roll"), get("name")
         if rid:
             by_id[rid] = r
-        roll = r.get("roll")
         if roll:
             by_roll[roll] = r
-        name = r.get("name")
         if name:
             by_name[name.strip().lower()] = r
-    return by_id, by_roll, by_name
+    by_name.update(by_roll)
+    by_name.update(by_id)
+    return by_name
 
-def _resolve_referer(ref_value, by_id, by_roll, by_name):
+def _resolve_referer(ref_value, ref_map):
     if not ref_value or not isinstance(ref_value, str):
         return None
     ref_value = ref_value.strip()
-    # Prefer registration_id
-    if ref_value in by_id:
-        return by_id[ref_value]
-    # Try roll
-    if ref_value in by_roll:
-        return by_roll[ref_value]
-    # Try case-insensitive name
-    key = ref_value.lower()
-    if key in by_name:
-        return by_name[key]
-    return None
-
-def _build_ref_section(entry, by_id, by_roll, by_name, id_to_file):
-    ref_val = entry.get("referred_by")
-    if not ref_val:
+    # IDs and rolls match exactly; names case-insensitively (only lowered on a miss)
+    referer = ref_map.get(ref_value)
+    if referer is None:
+        key = ref_value.lower()
+        if key != ref_value:
+            referer = ref_map.get(key)
+    return referer
+
+def _escape_fields(registrants: list[dict]):
+    """Store HTML-escaped copies of the displayed fields on each registrant.
+
+    Escaping happens once here, so the master list and referral sections can
+    interpolate the `_*_h` fields directly.
+    """
+    for r in registrants:
+        r["_name_h"] = html.escape(str(r.get("name") or ""))
+        r["_roll_h"] = html.escape(str(r.get("roll") or ""))
+        r["_id_h"] = html.escape(str(r.get("registration_id") or ""))
+        r["_date_h"] = html.escape(str(r.get("registration_date") or ""))
+        ref = r.get("referred_by")
+        r["_ref_h"] = html.escape(ref.strip()) if isinstance(ref, str) else html.escape(str(ref or ""))
+
+def _build_ref_section(entry, referer, id_to_file):
+    if not entry.get("referred_by"):
         return ""
-    referer = _resolve_referer(ref_val, by_id, by_roll, by_name)
     if referer:
         href = id_to_file.get(referer.get("registration_id"), "#")
-        label = referer.get("name", ref_val)
+        label = referer.get("_name_h") or entry["_ref_h"]
         return f'''
                 <div style="display: flex; justify-content: space-between; align-items: center;">
                     <span style="color: #6b7280; font-weight: 500;">Referred By</span>
@@ -931,7 +935,7 @@ def _build_ref_section(entry, by_id, by_roll, by_name, id_to_file):
                 </div>
         '''
     # fallback: show text as-is
-    safe_text = str(ref_val)
+    safe_text = entry["_ref_h"]
     return f'''
                 <div style="display: flex; justify-content: space-between; align-items: center;">
                     <span style="color: #6b7280; font-weight: 500;">Referred By</span>
@@ -939,24 +943,103 @@ def _build_ref_section(entry, by_id, by_roll, by_name, id_to_file):
                 </div>
     '''
 
-def _copy_static_pages(out_dir: Path):
-    """Copy index.html, 404.html and registrants.json from repo root (verify/) into out_dir."""
+def _format_ref_cell(entry, referer, id_to_file):
+    """Master-list "Referred By" cell: link to the referrer, the raw text, or a dash."""
+    if referer:
+        return f'<a href="{id_to_file.get(referer.get("registration_id"), "#")}">{referer["_name_h"]}</a>'
+    ref_val = entry.get("referred_by")
+    if isinstance(ref_val, str) and ref_val.strip():
+        return f'<span style="color: #1f2937; font-weight: 600;">{entry["_ref_h"]}</span>'
+    return "—"
+
+def _resolve_referrals(registrants: list[dict], ref_map: dict, id_to_file: dict):
+    """Resolve every referrer once, storing the page section (`_ref_section`) and
+    master-list cell (`_ref_cell`) HTML on each registrant."""
+    for entry in registrants:
+        ref_val = entry.get("referred_by")
+        referer = _resolve_referer(ref_val, ref_map) if ref_val else None
+        entry["_ref_section"] = _build_ref_section(entry, referer, id_to_file)
+        entry["_ref_cell"] = _format_ref_cell(entry, referer, id_to_file)
+
+def _fast_copy(src: Path, dst: Path) -> bool:
+    """Copy src to dst, preserving metadata. Returns False (no copy) if dst already
+    has the same size and mtime, as left by a previous copy.
+
+    Uses in-kernel os.copy_file_range where available (zero-copy, reflinks on
+    supporting filesystems), falling back to shutil.copy2.
+    """
+    st = src.stat()
+    try:
+        dst_st = dst.stat()
+        if os.path.samestat(st, dst_st):
+            # A hardlink left by a --hardlink build: writing would truncate src itself
+            dst.unlink()
+        elif (dst_st.st_size, dst_st.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
+    _ensure_dir(dst.parent)
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = st.st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            shutil.copystat(src, dst)
+            return True
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return True
+
+def _install(src: Path, dst: Path) -> bool:
+    """Hardlink src to dst (no data copied) when both are on one filesystem, else
+    _fast_copy it. Returns False if dst is already up to date.
+
+    dst shares its data with src afterwards: editing it in place edits the repo
+    source too. Only used with --hardlink.
+    """
+    st = src.stat()
+    try:
+        dst_st = dst.stat()
+        if os.path.samestat(st, dst_st) or (dst_st.st_size, dst_st.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            return False
+        # Never write through an old link into whatever file it still shares data with
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    _ensure_dir(dst.parent)
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        return _fast_copy(src, dst)
+
+def _copy_static_pages(out_dir: Path, hardlink: bool = False):
+    """Copy index.html, 404.html, registrants.json and the shared assets from repo root (verify/) into out_dir.
+    With hardlink, they are hardlinked instead where possible (see _install)."""
+    install = _install if hardlink else _fast_copy
     for name in ("index.html", "404.html"):
         src = ROOT_DIR / name
         if src.is_file():
             dst = out_dir / name
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            console.print(f":page_facing_up: Copied [path]{src}[/path] -> [path]{dst}[/path]", style="info")
+            if install(src, dst):
+                console.print(f":page_facing_up: Copied [path]{src}[/path] -> [path]{dst}[/path]", style="info")
+            else:
+                log.debug("Unchanged: %s", dst)
         else:
             console.print(f"[warning]Static page not found:[/warning] [path]{src}[/path]")
 
     # Copy the registrants.json file so the output bundle includes the source data
     if REG_JSON.is_file():
         dst = out_dir / REG_JSON.name
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(REG_JSON, dst)
-        console.print(f":page_facing_up: Copied [path]{REG_JSON}[/path] -> [path]{dst}[/path]", style="info")
+        if install(REG_JSON, dst):
+            console.print(f":page_facing_up: Copied [path]{REG_JSON}[/path] -> [path]{dst}[/path]", style="info")
+        else:
+            log.debug("Unchanged: %s", dst)
     else:
         console.print(f"[warning]registrants.json not found:[/warning] [path]{REG_JSON}[/path]")
 
@@ -964,22 +1047,54 @@ def _copy_static_pages(out_dir: Path):
     logo_src = ROOT_DIR / "logo.png"
     if logo_src.is_file():
         dst_logo = out_dir / "assets" / "logo.png"
-        dst_logo.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(logo_src, dst_logo)
-        console.print(f":frame_with_picture: Copied [path]{logo_src}[/path] -> [path]{dst_logo}[/path]", style="info")
+        if install(logo_src, dst_logo):
+            console.print(f":frame_with_picture: Copied [path]{logo_src}[/path] -> [path]{dst_logo}[/path]", style="info")
+        else:
+            log.debug("Unchanged: %s", dst_logo)
     else:
         console.print(f"[warning]logo.png not found:[/warning] [path]{logo_src}[/path]")
 
-    # Ensure default meta image is copied into output assets so previews fall back correctly
+    # Master list table script (sorting, dividers), loaded by master_list.html
+    table_js = ROOT_DIR / "assets" / "table.js"
+    if table_js.is_file():
+        dst_js = out_dir / "assets" / "table.js"
+        if install(table_js, dst_js):
+            console.print(f":page_facing_up: Copied [path]{table_js}[/path] -> [path]{dst_js}[/path]", style="info")
+        else:
+            log.debug("Unchanged: %s", dst_js)
+    else:
+        console.print(f"[warning]table.js not found:[/warning] [path]{table_js}[/path]")
+
+    # Ensure default meta image is copied into output assets so previews fall back correctly;
+    # always a real copy, never linked into the tree the meta cards are written to
     meta_src = ROOT_DIR / "assets" / "meta_card.png"
     if meta_src.is_file():
         dst_meta = out_dir / "assets" / "meta_card.png"
-        dst_meta.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(meta_src, dst_meta)
-        console.print(f":frame_with_picture: Copied default meta image [path]{meta_src}[/path] -> [path]{dst_meta}[/path]", style="info")
+        if _fast_copy(meta_src, dst_meta):
+            console.print(f":frame_with_picture: Copied default meta image [path]{meta_src}[/path] -> [path]{dst_meta}[/path]", style="info")
+        else:
+            log.debug("Unchanged: %s", dst_meta)
     else:
         console.print(f"[warning]Default meta image not found:[/warning] [path]{meta_src}[/path]")
 
+def _archive_add(tf: tarfile.TarFile, name: str, data: bytes, mtime: float):
+    """Append an in-memory file to the archive."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = mtime
+    info.mode = 0o644
+    tf.addfile(info, BytesIO(data))
+
+def _archive_outputs(tf: tarfile.TarFile, out_dir: Path):
+    """Add the files written to disk (static pages, assets, meta images) to the archive."""
+    for name in ("index.html", "404.html", REG_JSON.name):
+        path = out_dir / name
+        if path.is_file():
+            tf.add(path, arcname=name)
+    assets = out_dir / "assets"
+    if assets.is_dir():
+        tf.add(assets, arcname="assets")
+
 def _filter_registrants(registrants: list[dict], ids: Optional[Iterable[str]], limit: Optional[int]) -> list[dict]:
     if ids:
         wanted = {i.strip() for i in ids if i and i.strip()}
@@ -988,6 +1103,106 @@ def _filter_registrants(registrants: list[dict], ids: Optional[Iterable[str]], l
         return registrants[:limit]
     return registrants
 
+def _render_one(entry: dict, template_segments: list[str], id_to_names: dict,
+                out_dir: str, meta_dir: Path, meta_cache_dir: Optional[Path], regenerate_meta: bool, meta_format: str = "png",
+                manifest: dict | None = None, archive: bool = False, meta_hashes: dict | None = None):
+    """Render one registrant's page and meta image.
+
+    Runs in a worker process, so it only takes picklable arguments. Returns
+    (changed, meta, entries, content): changed is None if the entry was skipped,
+    otherwise whether the page was written; meta is (meta_file_path, meta_name)
+    for a generated meta image, else None; entries are this registrant's manifest
+    entries (page and meta image hashes; None means drop the entry) for the caller
+    to merge. With archive, the page is not written and content carries its bytes
+    for the caller to add to the tarball; otherwise content is None. meta_hashes
+    maps registration IDs to meta card input hashes already computed by the caller.
+    """
+    # Read each field once; the defaults match what the page and card display
+    get = entry.get
+    reg_id = get("registration_id", "")
+    # Skip entries without registration_id
+    if not reg_id:
+        # Name as a separate Text renderable so Rich never parses it as markup
+        console.print("[warning]Skipping entry without registration_id:[/warning]", Text(str(get("name", "<unknown>"))))
+        return None, None, None, None
+    name = get("name", "Registrant")
+
+    # Page and meta image filenames, precomputed per ID in main
+    names = id_to_names.get(reg_id)
+    if names is None:
+        slug = id_to_filename(reg_id)
+        names = (f"{slug}.html", f"{slug}.{meta_format}")
+    filename, meta_name = names
+    out_path = os.path.join(out_dir, filename)  # plain str: no Path objects per page
+
+    meta_rel_path = f"/assets/meta/{meta_name}"
+    meta_file_path = meta_dir / meta_name
+
+    # One status lookup shared by the meta card and the page
+    status = _status_for(entry)
+
+    if manifest is None:
+        manifest = {}
+    # Attempt to generate meta image (best-effort) with caching support
+    meta = None
+    meta_rel = "/assets/meta_card.png"  # default card, copied by _copy_static_pages
+    try:
+        generated = PIL_AVAILABLE and generate_meta_card(
+            meta_file_path,
+            *_card_fields(entry),
+            force_regenerate=regenerate_meta,
+            cache_dir=meta_cache_dir,
+            image_format=meta_format,
+            hashes=manifest,
+            meta_hash=meta_hashes.get(reg_id) if meta_hashes else None,
+        )
+        if generated and meta_file_path.is_file():
+            # Track for potential caching
+            meta = (meta_file_path, meta_name)
+            meta_rel = meta_rel_path
+    except Exception as e:
+        console.print(f"[warning]Meta generation failed for {reg_id}: {e}[/warning]")
+
+    # Build canonical URL and page metadata
+    canonical_url = f"https://chayannito26.com/{filename}"
+    page_title = f"{name} — Verification"
+    page_description = f"Verification card for {get('name', '')} ({reg_id})"
+
+    extra = {
+        "page_title": page_title,
+        "page_description": page_description,
+        "canonical_url": canonical_url,
+        "meta_image": meta_rel,
+        "referred_by_section": entry["_ref_section"],
+    }
+
+    content = render_template(template_segments, entry, extra, status).encode("utf-8")
+    meta_key = _meta_manifest_key(meta_file_path)
+    entries = {meta_key: manifest.get(meta_key)}
+    if archive:
+        return True, meta, entries, content
+    changed = write_if_changed(out_path, content, manifest)
+    entries[filename] = manifest.get(filename)
+    return changed, meta, entries, None
+
+# _render_one's shared keyword arguments, installed once per worker process by _init_worker
+_WORKER_ARGS: dict = {}
+
+def _setup_logging(level: int):
+    """Send the "verify" logger's records at level and above to the Rich console."""
+    log.setLevel(level)
+    if not log.handlers:
+        log.addHandler(RichHandler(console=console, show_path=False, show_time=False, markup=False))
+        log.propagate = False
+
+def _init_worker(render_args: dict, log_level: int = logging.WARNING):
+    _WORKER_ARGS.update(render_args)
+    # Forked workers inherit the handler; spawned ones start with a fresh logger
+    _setup_logging(log_level)
+
+def _render_shared(entry: dict):
+    return _render_one(entry, **_WORKER_ARGS)
+
 def main(argv: Optional[list[str]] = None):
     parser = argparse.ArgumentParser(description="Generate verification pages")
     parser.add_argument("--out", default=str(ROOT_DIR / "dist"), help="Output directory for generated site")
@@ -995,11 +1210,19 @@ def main(argv: Optional[list[str]] = None):
     parser.add_argument("--limit", type=int, default=None, help="Generate only first N registrants")
     parser.add_argument("--ids", type=str, default=None, help="Comma-separated registration_id list to generate")
     parser.add_argument("--no-static", action="store_true", help="Do not copy index.html and 404.html into output")
+    parser.add_argument("--hardlink", action="store_true", help="Hardlink static files into output instead of copying (edits to them in output change the repo sources)")
     parser.add_argument("--master-only", action="store_true", help="Only generate the master_list.html and static files (skip per-registrant pages)")
     parser.add_argument("--regenerate-meta", action="store_true", help="Force regenerate all meta images even if cached versions exist")
     parser.add_argument("--cache-meta", action="store_true", help="After generating, copy new meta images back to meta_images/ for caching")
+    parser.add_argument("--meta-format", choices=("png", "webp"), default="png", help="Image format for per-registrant meta cards")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for per-registrant pages (default: CPU count)")
+    parser.add_argument("--archive", action="store_true", help=f"Write pages into <out>/{ARCHIVE_NAME} instead of individual HTML files")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every page, meta image and avatar as it is processed")
     args = parser.parse_args(argv)
 
+    # Per-file messages are DEBUG records on the "verify" logger; shown only with --verbose
+    _setup_logging(logging.DEBUG if args.verbose else logging.WARNING)
+
     console.rule("[bold cyan]Chayannito 26 – Verification Generator")
 
     # Prepare output directory
@@ -1008,19 +1231,25 @@ def main(argv: Optional[list[str]] = None):
         if args.clean and out_dir.exists():
             console.print(f":broom: [warning]Cleaning[/warning] [path]{out_dir}[/path]")
             shutil.rmtree(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
+            _forget_dirs(out_dir)
+        _ensure_dir(out_dir)
 
     # Validate and load inputs
     with console.status("[cyan]Loading template and data..."):
         if not REG_JSON.is_file():
             console.print(f"[error]Error:[/error] [path]{REG_JSON}[/path] not found.")
             return
-        if not TEMPLATE_FILE.is_file():
-            console.print(f"[error]Error:[/error] [path]{TEMPLATE_FILE}[/path] not found.")
-            return
-        template_text = TEMPLATE_FILE.read_text(encoding="utf-8")
-        with open(REG_JSON, "r", encoding="utf-8") as f:
-            all_registrants = json.load(f)
+        for required in (TEMPLATE_FILE, MASTER_TEMPLATE_FILE):
+            if not required.is_file():
+                console.print(f"[error]Error:[/error] [path]{required}[/path] not found.")
+                return
+        template_segments = _compile_template(TEMPLATE_FILE.read_text(encoding="utf-8"))
+        all_registrants = _json_loads(REG_JSON.read_bytes())
+        # Intern IDs so index lookups and referral matches compare by identity first
+        for r in all_registrants:
+            rid = r.get("registration_id")
+            if rid and isinstance(rid, str):
+                r["registration_id"] = sys.intern(rid)
 
     # --- Add placeholder entries for special IDs if they don't exist ---
     existing_ids = {r["registration_id"] for r in all_registrants if "registration_id" in r}
@@ -1038,6 +1267,8 @@ def main(argv: Optional[list[str]] = None):
                 "is_placeholder": True,
             })
 
+    _escape_fields(all_registrants)
+
     # Calculate statistics on all registrants (excluding placeholders)
     stats = calculate_statistics(all_registrants)
 
@@ -1047,134 +1278,166 @@ def main(argv: Optional[list[str]] = None):
     console.print(f":mag: [info]Filtered registrants:[/info] {len(registrants)}")
 
     # Mapping and indexes based on filtered set
-    id_to_file = {}
+    id_to_slug = {}
     for r in registrants:
         reg_id = r.get("registration_id", "")
         if reg_id:
-            id_to_file[reg_id] = f"{id_to_filename(reg_id)}.html"
-
-    by_id, by_roll, by_name = _build_indexes(registrants)
-    files_written = 0
-    files_unchanged = 0
-    
-    # Meta image cache directory (in repo root)
-    meta_cache_dir = ROOT_DIR / "meta_images"
-    newly_generated_meta = []  # Track newly generated images for caching
-
-    if not args.master_only:
-        # Generate per-registrant pages and meta images
-        console.print(":sparkles: [info]Generating per-registrant pages...[/info]")
-        meta_out_dir = out_dir / "assets" / "meta"
-        meta_out_dir.mkdir(parents=True, exist_ok=True)
-
+            id_to_slug[reg_id] = id_to_filename(reg_id)
+    id_to_file = {reg_id: f"{slug}.html" for reg_id, slug in id_to_slug.items()}
+    id_to_names = {reg_id: (id_to_file[reg_id], f"{slug}.{args.meta_format}") for reg_id, slug in id_to_slug.items()}
+
+    _resolve_referrals(registrants, _build_indexes(registrants), id_to_file)
+    manifest = _load_manifest(out_dir)
+    # One sequential tarball instead of thousands of small page files; written under a
+    # temporary name and renamed into place only once the build has finished
+    archive_path = out_dir / ARCHIVE_NAME
+    archive_tmp = archive_path.with_name(f"{ARCHIVE_NAME}.{os.getpid()}.tmp")
+    archive = tarfile.open(archive_tmp, "w", bufsize=256 * 1024) if args.archive else None
+    try:
+        build_time = time.time()
+        files_written = 0
+        files_unchanged = 0
+
+        # Meta image cache directory (in repo root)
+        meta_cache_dir = ROOT_DIR / "meta_images"
+        newly_generated_meta = []  # Track newly generated images for caching
+
+        if not args.master_only:
+            # Generate per-registrant pages and meta images
+            console.print(":sparkles: [info]Generating per-registrant pages...[/info]")
+            meta_out_dir = out_dir / "assets" / "meta"
+            _ensure_dir(meta_out_dir)
+
+            # Meta card input hashes, computed once below (before any worker starts)
+            meta_hashes = {}
+            render_args = dict(
+                template_segments=template_segments,
+                id_to_names=id_to_names,
+                out_dir=os.fspath(out_dir),
+                meta_dir=meta_out_dir,
+                meta_cache_dir=meta_cache_dir if meta_cache_dir.exists() else None,
+                regenerate_meta=args.regenerate_meta,
+                meta_format=args.meta_format,
+                manifest=manifest,
+                archive=archive is not None,
+                meta_hashes=meta_hashes,
+            )
+            if PIL_AVAILABLE:
+                # Only cards that will be drawn need an avatar; kept and repo-cached cards do not
+                if args.regenerate_meta:
+                    to_draw = registrants
+                else:
+                    # Cards copied from the repo cache need neither a hash nor an avatar
+                    cache = render_args["meta_cache_dir"]
+                    to_hash = [
+                        r for r in registrants
+                        if r.get("registration_id") and not (cache is not None and (cache / id_to_names[r["registration_id"]][1]).is_file())
+                    ]
+                    # Revalidate expired avatar downloads first (usually a 304), so an unchanged
+                    # avatar keeps its card instead of forcing a redraw
+                    with console.status("[cyan]Revalidating avatars..."):
+                        _prefetch_avatars(to_hash, stale_only=True)
+                    to_draw = []
+                    for r in to_hash:
+                        reg_id = r["registration_id"]
+                        meta_path = meta_out_dir / id_to_names[reg_id][1]
+                        meta_hashes[reg_id] = meta_hash = _compute_meta_hash(*_card_fields(r), SITE_NAME)
+                        if not _meta_card_unchanged(meta_path, meta_hash, manifest):
+                            to_draw.append(r)
+                with console.status("[cyan]Fetching avatars..."):
+                    _prefetch_avatars(to_draw)
+            else:
+                console.print("[warning]Pillow not available — skipping meta image generation (pages use the default card)[/warning]")
+            jobs = args.jobs or os.cpu_count() or 1
+            # Pages are independent; fan out across processes (Pillow encode is CPU-bound)
+            # On Linux, fork lets workers inherit the loaded module and arguments instead of re-importing.
+            # Elsewhere keep the platform default: macOS spawns because forking after system frameworks
+            # (used here by the avatar prefetch threads) is unsafe
+            mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+            # Shared arguments (and the log level, for spawned workers) go to each worker once via the
+            # initializer, not with every chunk of tasks
+            executor = ProcessPoolExecutor(
+                max_workers=jobs, mp_context=mp_context, initializer=_init_worker, initargs=(render_args, log.level),
+            ) if jobs > 1 and len(registrants) > 1 else None
+            try:
+                if executor:
+                    results = executor.map(_render_shared, registrants, chunksize=64)
+                else:
+                    results = map(functools.partial(_render_one, **render_args), registrants)
+                with Progress(
+                    SpinnerColumn(), TextColumn("[info]Rendering pages[/info]"), BarColumn(),
+                    TaskProgressColumn(), TimeElapsedColumn(), console=console, refresh_per_second=8,
+                ) as progress:
+                    task = progress.add_task("render", total=len(registrants))
+                    for done, (entry, (changed, meta, entries, content)) in enumerate(zip(registrants, results), 1):
+                        # Batch bar updates; the final one lands after the loop
+                        if not done & 63:
+                            progress.update(task, completed=done)
+                        if changed is None:
+                            continue
+                        # Workers update their own copy of the manifest; fold their entries back in
+                        for key, value in entries.items():
+                            if value is None:
+                                manifest.pop(key, None)
+                            else:
+                                manifest[key] = value
+                        if content is not None:
+                            _archive_add(archive, id_to_file[entry["registration_id"]], content, build_time)
+                        if changed:
+                            files_written += 1
+                        else:
+                            files_unchanged += 1
+                        if meta:
+                            newly_generated_meta.append(meta)
+                    progress.update(task, completed=len(registrants))
+            finally:
+                if executor:
+                    executor.shutdown()
+
+        # Build master-list rows, links and ref_cells in one pass (placeholders are not listed)
+        final_registrants_for_master_list = []
+        final_links = []
+        final_ref_cells = []
         for entry in registrants:
+            if entry.get("is_placeholder"):
+                continue
+            final_registrants_for_master_list.append(entry)
             reg_id = entry.get("registration_id", "")
-            # Skip entries without registration_id
             if not reg_id:
-                console.print(f"[warning]Skipping entry without registration_id: {entry.get('name', '<unknown>')}[/warning]")
+                final_links.append("#")
+                final_ref_cells.append("—")
                 continue
-
-            filename = id_to_file.get(reg_id, id_to_filename(reg_id) + ".html")
-            out_path = out_dir / filename
-
-            # Build meta image filename (no extension collisions)
-            meta_name = Path(filename).stem + ".png"
-            meta_rel_path = f"/assets/meta/{meta_name}"
-            meta_file_path = meta_out_dir / meta_name
-
-            # Determine status text similar to render_template
-            if entry.get("revoked") is True:
-                status_text = "Registration Revoked"
-            elif entry.get("is_placeholder"):
-                status_text = "Not Yet Registered"
-            else:
-                status_text = "Registration Verified"
-
-            # Attempt to generate meta image (best-effort) with caching support
-            photo_url = entry.get("photo") or None
-            try:
-                generated = generate_meta_card(
-                    meta_file_path, 
-                    entry.get("name", "Registrant"), 
-                    entry.get("roll", ""), 
-                    reg_id, 
-                    photo_url, 
-                    status_text, 
-                    entry.get("registration_date", ""),
-                    force_regenerate=args.regenerate_meta,
-                    cache_dir=meta_cache_dir if meta_cache_dir.exists() else None
-                )
-                if generated and meta_file_path.is_file():
-                    # Track for potential caching
-                    newly_generated_meta.append((meta_file_path, meta_name))
-                    meta_rel = meta_rel_path
-                else:
-                    # fallback to default meta card (copied by _copy_static_pages)
-                    meta_rel = "/assets/meta_card.png"
-            except Exception as e:
-                console.print(f"[warning]Meta generation failed for {reg_id}: {e}[/warning]")
-                meta_rel = "/assets/meta_card.png"
-
-            # Build canonical URL and page metadata
-            canonical_url = f"https://chayannito26.com/{filename}"
-            page_title = f"{entry.get('name', 'Registrant')} — Verification"
-            page_description = f"Verification card for {entry.get('name', '')} ({reg_id})"
-
-            # Build referred_by section
-            referred_html = _build_ref_section(entry, by_id, by_roll, by_name, id_to_file)
-
-            extra = {
-                "page_title": page_title,
-                "page_description": page_description,
-                "canonical_url": canonical_url,
-                "meta_image": meta_rel,
-                "referred_by_section": referred_html,
-            }
-
-            content = render_template(template_text, entry, extra)
-
-            if write_if_changed(out_path, content):
-                files_written += 1
-            else:
-                files_unchanged += 1
-
-    # Build links and ref_cells for master list
-    links = []
-    ref_cells = []
-    for entry in registrants:
-        reg_id = entry.get("registration_id", "")
-        if not reg_id:
-            links.append("#")
-            ref_cells.append("—")
-            continue
-        filename = id_to_file.get(reg_id, "#")
-        links.append(filename)
-        ref_val = entry.get("referred_by")
-        referer = _resolve_referer(ref_val, by_id, by_roll, by_name) if ref_val else None
-        if referer:
-            ref_link = id_to_file.get(referer.get("registration_id"), "#")
-            ref_cells.append(f'<a href="{ref_link}">{referer.get("name")}</a>')
+            final_links.append(id_to_file.get(reg_id, "#"))
+            final_ref_cells.append(entry["_ref_cell"])
+
+        # Render and write master list
+        master_html = render_master_list(final_registrants_for_master_list, final_links, final_ref_cells, stats)
+        if archive:
+            _archive_add(archive, "master_list.html", master_html.encode("utf-8"), build_time)
+            changed_master = True
         else:
-            if ref_val and isinstance(ref_val, str) and ref_val.strip():
-                ref_cells.append(f'<span style="color: #1f2937; font-weight: 600;">{ref_val.strip()}</span>')
-            else:
-                ref_cells.append("—")
-
-    # Render and write master list
-    final_registrants_for_master_list = [r for r in registrants if not r.get("is_placeholder")]
-    final_links = [links[i] for i, r in enumerate(registrants) if not r.get("is_placeholder")]
-    final_ref_cells = [ref_cells[i] for i, r in enumerate(registrants) if not r.get("is_placeholder")]
-
-    master_html = render_master_list(final_registrants_for_master_list, final_links, final_ref_cells, stats)
-    changed_master = write_if_changed(out_dir / "master_list.html", master_html)
-    if changed_master:
-        files_written += 1
-    else:
-        files_unchanged += 1
-
-    # Copy static files unless explicitly disabled
-    if not args.no_static:
-        _copy_static_pages(out_dir)
+            changed_master = write_if_changed(out_dir / "master_list.html", master_html.encode("utf-8"), manifest)
+        if changed_master:
+            files_written += 1
+        else:
+            files_unchanged += 1
+        _save_manifest(out_dir, manifest)
+
+        # Copy static files unless explicitly disabled
+        if not args.no_static:
+            _copy_static_pages(out_dir, hardlink=args.hardlink)
+
+        if archive:
+            _archive_outputs(archive, out_dir)
+    except BaseException:
+        if archive:
+            archive.close()
+            archive_tmp.unlink(missing_ok=True)
+        raise
+    if archive:
+        archive.close()
+        os.replace(archive_tmp, archive_path)
+        console.print(f":package: [info]Wrote archive[/info] [path]{archive_path}[/path]")
     
     # Cache newly generated meta images back to repo if requested
     if args.cache_meta and newly_generated_meta: